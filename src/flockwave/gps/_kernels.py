@@ -0,0 +1,284 @@
+"""Low-level numeric kernels of the coordinate transformations.
+
+The functions in this module work on plain floats only so they can be used
+both by the object-based API in ``flockwave.gps.vectors`` and by callers that
+convert many points and do not want to allocate a coordinate object for each
+of them.
+"""
+
+from __future__ import annotations
+
+from math import acos, asin, atan2, cos, sin, sqrt
+
+__all__ = (
+    "ecef_from_geodetic",
+    "geodetic_from_ecef",
+    "geodetic_from_ecef_array",
+    "haversine_distance",
+    "olson_parameters",
+)
+
+
+def ecef_from_geodetic(
+    lat: float,
+    lon: float,
+    height: float,
+    a: float,
+    e2: float,
+    *,
+    _sin=sin,
+    _cos=cos,
+    _sqrt=sqrt,
+) -> tuple[float, float, float]:
+    """Converts geodetic coordinates to ECEF coordinates.
+
+    Parameters:
+        lat: the latitude, in radians
+        lon: the longitude, in radians
+        height: the height above the ellipsoid, in metres
+        a: the equatorial radius of the ellipsoid, in metres
+        e2: the square of the eccentricity of the ellipsoid
+
+    Returns:
+        the X, Y and Z coordinates, in metres
+    """
+    # The math functions are bound as keyword-only default arguments so they
+    # are looked up as fast locals instead of module globals on every call.
+    # Python has no sincos(); the best we can do is to evaluate the sine and
+    # the cosine of each angle exactly once
+    sin_lat, cos_lat = _sin(lat), _cos(lat)
+    sin_lon, cos_lon = _sin(lon), _cos(lon)
+    n = a / _sqrt(1 - e2 * sin_lat * sin_lat)
+    return (
+        (n + height) * cos_lat * cos_lon,
+        (n + height) * cos_lat * sin_lon,
+        (n * (1 - e2) + height) * sin_lat,
+    )
+
+
+def geodetic_from_ecef(
+    x: float,
+    y: float,
+    z: float,
+    a: float,
+    e2: float,
+    a1: float,
+    a2: float,
+    a3: float,
+    a4: float,
+    a5: float,
+    a6: float,
+    *,
+    _abs=abs,
+    _asin=asin,
+    _acos=acos,
+    _atan2=atan2,
+    _sqrt=sqrt,
+) -> tuple[float, float, float]:
+    """Converts ECEF coordinates to geodetic coordinates.
+
+    Uses the closed-form method of Olson (1996): Converting Earth-centered,
+    Earth-fixed coordinates to geodetic coordinates. IEEE Transactions on
+    Aerospace and Electronic Systems 32(1), pp. 473-476.
+
+    Parameters:
+        x: the X coordinate, in metres
+        y: the Y coordinate, in metres
+        z: the Z coordinate, in metres
+        a: the equatorial radius of the ellipsoid, in metres
+        e2: the square of the eccentricity of the ellipsoid
+        a1: auxiliary constant of the method; see `olson_parameters()`
+        a2: auxiliary constant of the method; see `olson_parameters()`
+        a3: auxiliary constant of the method; see `olson_parameters()`
+        a4: auxiliary constant of the method; see `olson_parameters()`
+        a5: auxiliary constant of the method; see `olson_parameters()`
+        a6: auxiliary constant of the method; see `olson_parameters()`
+
+    Returns:
+        the latitude and the longitude (in radians) and the height above the
+        ellipsoid (in metres)
+    """
+    # Math functions are bound as default arguments; see `ecef_from_geodetic()`
+    zp = _abs(z)
+    w2 = x * x + y * y
+    w = _sqrt(w2)
+    z2 = z * z
+    r2 = w2 + z2
+    if r2 == 0:
+        # The method divides by the distance from the center of the Earth
+        return 0.0, 0.0, -a
+
+    r = _sqrt(r2)
+    lon = _atan2(y, x)
+
+    s2 = z2 / r2
+    c2 = w2 / r2
+    u = a2 / r
+    v = a3 - a4 / r
+
+    # Initial estimate of the latitude; the branches avoid the loss of
+    # precision of asin() near the poles and acos() near the equator
+    if c2 > 0.3:
+        s = (zp / r) * (1 + c2 * (a1 + u + s2 * v) / r)
+        lat = _asin(s)
+        ss = s * s
+        c = _sqrt(1 - ss)
+    else:
+        c = (w / r) * (1 - s2 * (a5 - u - c2 * v) / r)
+        lat = _acos(c)
+        ss = 1 - c * c
+        s = _sqrt(ss)
+
+    # Single correction step
+    g = 1 - e2 * ss
+    rg = a / _sqrt(g)
+    rf = a6 * rg
+    u = w - rg * c
+    v = zp - rf * s
+    f = c * u + s * v
+    m = c * v - s * u
+    p = m / (rf / g + f)
+
+    lat += p
+    height = f + m * p / 2
+    return (-lat if z < 0 else lat), lon, height
+
+
+def geodetic_from_ecef_array(
+    np,
+    x,
+    y,
+    z,
+    a: float,
+    e2: float,
+    a1: float,
+    a2: float,
+    a3: float,
+    a4: float,
+    a5: float,
+    a6: float,
+):
+    """Vectorized variant of `geodetic_from_ecef()` that works on NumPy arrays.
+
+    Parameters:
+        np: the NumPy module; passed in by the caller so this module does not
+            depend on NumPy
+        x: the X coordinates, in metres
+        y: the Y coordinates, in metres
+        z: the Z coordinates, in metres
+        a: the equatorial radius of the ellipsoid, in metres
+        e2: the square of the eccentricity of the ellipsoid
+        a1: auxiliary constant of the method; see `olson_parameters()`
+        a2: auxiliary constant of the method; see `olson_parameters()`
+        a3: auxiliary constant of the method; see `olson_parameters()`
+        a4: auxiliary constant of the method; see `olson_parameters()`
+        a5: auxiliary constant of the method; see `olson_parameters()`
+        a6: auxiliary constant of the method; see `olson_parameters()`
+
+    Returns:
+        the arrays of latitudes and longitudes (in radians) and heights above
+        the ellipsoid (in metres)
+    """
+    zp = np.abs(z)
+    w2 = x * x + y * y
+    w = np.sqrt(w2)
+    z2 = z * z
+    r2 = w2 + z2
+    # The method divides by the distance from the center of the Earth; points
+    # at the center are calculated with a dummy distance and fixed at the end
+    at_center = r2 == 0
+    r2 = np.where(at_center, 1.0, r2)
+    r = np.sqrt(r2)
+    lon = np.arctan2(y, x)
+
+    s2 = z2 / r2
+    c2 = w2 / r2
+    u = a2 / r
+    v = a3 - a4 / r
+
+    # Both branches of the scalar version are evaluated for all points, but
+    # the inverse trigonometric functions only where they are accurate
+    use_asin = c2 > 0.3
+    use_acos = ~use_asin
+    s = (zp / r) * (1 + c2 * (a1 + u + s2 * v) / r)
+    c = (w / r) * (1 - s2 * (a5 - u - c2 * v) / r)
+    lat = np.empty_like(r)
+    lat[use_asin] = np.arcsin(s[use_asin])
+    lat[use_acos] = np.arccos(c[use_acos])
+    ss = np.where(use_asin, s * s, 1 - c * c)
+    s = np.where(use_asin, s, np.sqrt(ss))
+    c = np.where(use_asin, np.sqrt(1 - ss), c)
+
+    # Single correction step
+    g = 1 - e2 * ss
+    rg = a / np.sqrt(g)
+    rf = a6 * rg
+    u = w - rg * c
+    v = zp - rf * s
+    f = c * u + s * v
+    m = c * v - s * u
+    p = m / (rf / g + f)
+
+    lat += p
+    height = f + m * p / 2
+    lat = np.where(z < 0, -lat, lat)
+    if at_center.any():
+        lat = np.where(at_center, 0.0, lat)
+        height = np.where(at_center, -a, height)
+    return lat, lon, height
+
+
+def haversine_distance(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+    radius: float,
+    *,
+    _asin=asin,
+    _cos=cos,
+    _sin=sin,
+    _sqrt=sqrt,
+) -> float:
+    """Returns the great-circle distance of two points on a sphere using the
+    Haversine formula.
+
+    Parameters:
+        lat1: the latitude of the first point, in radians
+        lon1: the longitude of the first point, in radians
+        lat2: the latitude of the second point, in radians
+        lon2: the longitude of the second point, in radians
+        radius: the radius of the sphere, in metres
+
+    Returns:
+        the distance of the two points, in metres
+    """
+    # Math functions are bound as default arguments; see `ecef_from_geodetic()`.
+    # cos(lat1) * cos(lat2) is rewritten as cos(mean_lat)**2 - sin(half_dlat)**2
+    # so we need three trigonometric calls instead of four
+    sin_half_dlat = _sin((lat1 - lat2) * 0.5)
+    cos_mean_lat = _cos((lat1 + lat2) * 0.5)
+    sin_half_dlon = _sin((lon1 - lon2) * 0.5)
+    h = sin_half_dlat * sin_half_dlat
+    d = h + (cos_mean_lat * cos_mean_lat - h) * sin_half_dlon * sin_half_dlon
+    return 2 * radius * _asin(_sqrt(d))
+
+
+def olson_parameters(a: float, e2: float) -> tuple[float, ...]:
+    """Returns the ellipsoid-dependent parameters of `geodetic_from_ecef()`.
+
+    Parameters:
+        a: the equatorial radius of the ellipsoid, in metres
+        e2: the square of the eccentricity of the ellipsoid
+
+    Returns:
+        the parameters of `geodetic_from_ecef()` following the ECEF
+        coordinates, in the order they should be passed
+    """
+    a1 = a * e2
+    a2 = a1 * a1
+    a3 = a1 * e2 / 2
+    a4 = 2.5 * a2
+    a5 = a1 + a3
+    a6 = 1 - e2
+    return a, e2, a1, a2, a3, a4, a5, a6
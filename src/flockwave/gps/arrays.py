@@ -0,0 +1,261 @@
+"""Classes representing large batches of coordinates as parallel NumPy
+arrays instead of individual coordinate objects.
+
+The classes in this module require NumPy. The scalar classes in
+``flockwave.gps.vectors`` remain the primary API; the array classes are meant
+for code paths that store or transform many coordinates at once.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from .constants import WGS84
+from .distances import haversine_many
+from .vectors import ECEFCoordinate, ECEFToGPSCoordinateTransformation, GPSCoordinate
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+
+__all__ = ("ECEFCoordinateArray", "GPSCoordinateArray")
+
+
+def _numpy():
+    """Imports NumPy lazily, raising a helpful error if it is missing."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "You need to install 'numpy' to use coordinate arrays"
+        ) from None
+    return numpy
+
+
+def _as_column(np, values: Any, length: int, name: str) -> ndarray:
+    """Converts the given values into a one-dimensional float64 array of the
+    given length. ``None`` yields an array of NaNs, which is how missing
+    altitudes are represented.
+    """
+    if values is None:
+        return np.full(length, np.nan)
+
+    result = np.ascontiguousarray(values, dtype=np.float64)
+    if result.shape != (length,):
+        raise ValueError(f"{name} must be a one-dimensional array of length {length}")
+    return result
+
+
+def _optional(value: float) -> Optional[float]:
+    """Converts a single element of an altitude column back to a float,
+    mapping NaN to ``None``.
+    """
+    return None if value != value else float(value)
+
+
+class GPSCoordinateArray:
+    """Batch of GPS coordinates stored as parallel float64 arrays of
+    latitudes, longitudes and altitudes.
+
+    Missing altitudes are represented by NaN in the altitude arrays.
+    """
+
+    __slots__ = ("agl", "ahl", "amsl", "lat", "lon")
+
+    lat: ndarray
+    lon: ndarray
+    amsl: ndarray
+    ahl: ndarray
+    agl: ndarray
+
+    def __init__(
+        self,
+        lat: Any = (),
+        lon: Any = (),
+        amsl: Any = None,
+        ahl: Any = None,
+        agl: Any = None,
+    ):
+        """Constructor.
+
+        Parameters:
+            lat: the latitudes, in degrees
+            lon: the longitudes, in degrees
+            amsl: the altitudes above mean sea level, in metres. ``None``
+                means that none of them are known.
+            ahl: the altitudes above home level, in metres. ``None`` means
+                that none of them are known.
+            agl: the altitudes above ground level, in metres. ``None`` means
+                that none of them are known.
+
+        Raises:
+            ValueError: if the arrays are not one-dimensional or their
+                lengths differ
+        """
+        np = _numpy()
+
+        self.lat = np.ascontiguousarray(lat, dtype=np.float64)
+        if self.lat.ndim != 1:
+            raise ValueError("lat must be a one-dimensional array")
+
+        length = len(self.lat)
+        self.lon = _as_column(np, lon, length, "lon")
+        self.amsl = _as_column(np, amsl, length, "amsl")
+        self.ahl = _as_column(np, ahl, length, "ahl")
+        self.agl = _as_column(np, agl, length, "agl")
+
+    @classmethod
+    def from_coordinates(cls, coords: Iterable[GPSCoordinate]) -> GPSCoordinateArray:
+        """Creates an array from a sequence of GPS coordinates.
+
+        Parameters:
+            coords: the coordinates to store in the array
+
+        Returns:
+            a new array holding the given coordinates, in the same order
+        """
+        np = _numpy()
+        nan = np.nan
+        rows = [
+            (
+                coord._lat,
+                coord._lon,
+                nan if coord._amsl is None else coord._amsl,
+                nan if coord._ahl is None else coord._ahl,
+                nan if coord._agl is None else coord._agl,
+            )
+            for coord in coords
+        ]
+
+        # Transposing and copying makes each column contiguous in memory
+        columns = np.array(rows, dtype=np.float64).reshape(-1, 5).T.copy()
+        return cls(*columns)
+
+    def append(self, coord: GPSCoordinate) -> None:
+        """Appends a GPS coordinate to the end of the array.
+
+        Each call copies the underlying arrays, so prefer constructing the
+        array from complete columns when the data is available in bulk.
+
+        Parameters:
+            coord: the coordinate to append
+        """
+        np = _numpy()
+        nan = np.nan
+        amsl, ahl, agl = coord.amsl, coord.ahl, coord.agl
+        self.lat = np.append(self.lat, coord.lat)
+        self.lon = np.append(self.lon, coord.lon)
+        self.amsl = np.append(self.amsl, nan if amsl is None else amsl)
+        self.ahl = np.append(self.ahl, nan if ahl is None else ahl)
+        self.agl = np.append(self.agl, nan if agl is None else agl)
+
+    def haversine_to(self, other: GPSCoordinate, datum=WGS84) -> ndarray:
+        """Returns the distances of the points in this array from a single
+        point, using the Haversine formula.
+
+        Parameters:
+            other: the point to measure the distances from
+            datum: the datum whose mean radius is used
+
+        Returns:
+            the distances, in metres
+        """
+        return haversine_many(other, self.lat, self.lon, datum)
+
+    def to_ecef_array(
+        self, trans: Optional[ECEFToGPSCoordinateTransformation] = None
+    ) -> ECEFCoordinateArray:
+        """Converts all the coordinates in this array to ECEF coordinates.
+
+        Parameters:
+            trans: the transformation to use; ``None`` means to use one with
+                the WGS84 ellipsoid
+
+        Returns:
+            the converted coordinates
+        """
+        if trans is None:
+            trans = ECEFToGPSCoordinateTransformation()
+        return trans.to_ecef_array(self)
+
+    def __getitem__(self, index: int) -> GPSCoordinate:
+        return GPSCoordinate(
+            lat=float(self.lat[index]),
+            lon=float(self.lon[index]),
+            amsl=_optional(self.amsl[index]),
+            ahl=_optional(self.ahl[index]),
+            agl=_optional(self.agl[index]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} coordinates>)"
+
+
+class ECEFCoordinateArray:
+    """Batch of ECEF coordinates stored as a single float64 array with one
+    row per coordinate and three columns for the X, Y and Z coordinates.
+    """
+
+    __slots__ = ("xyz",)
+
+    xyz: ndarray
+
+    def __init__(self, xyz: Any = ()):
+        """Constructor.
+
+        Parameters:
+            xyz: the coordinates, in metres, as an array of shape (N, 3)
+
+        Raises:
+            ValueError: if the array does not have the right shape
+        """
+        np = _numpy()
+        xyz = np.asarray(xyz, dtype=np.float64)
+        if xyz.size == 0:
+            xyz = xyz.reshape(0, 3)
+        elif xyz.ndim != 2 or xyz.shape[1] != 3:
+            raise ValueError("xyz must be an array of shape (N, 3)")
+        self.xyz = xyz
+
+    @property
+    def x(self) -> ndarray:
+        """The X coordinates, as a view into the underlying array."""
+        return self.xyz[:, 0]
+
+    @property
+    def y(self) -> ndarray:
+        """The Y coordinates, as a view into the underlying array."""
+        return self.xyz[:, 1]
+
+    @property
+    def z(self) -> ndarray:
+        """The Z coordinates, as a view into the underlying array."""
+        return self.xyz[:, 2]
+
+    def to_gps_array(
+        self, trans: Optional[ECEFToGPSCoordinateTransformation] = None
+    ) -> GPSCoordinateArray:
+        """Converts all the coordinates in this array to GPS coordinates.
+
+        Parameters:
+            trans: the transformation to use; ``None`` means to use one with
+                the WGS84 ellipsoid
+
+        Returns:
+            the converted coordinates
+        """
+        if trans is None:
+            trans = ECEFToGPSCoordinateTransformation()
+        return trans.to_gps_array(self)
+
+    def __getitem__(self, index: int) -> ECEFCoordinate:
+        x, y, z = self.xyz[index]
+        return ECEFCoordinate(x=float(x), y=float(y), z=float(z))
+
+    def __len__(self) -> int:
+        return len(self.xyz)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} coordinates>)"
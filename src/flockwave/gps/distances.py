@@ -1,11 +1,18 @@
 """Distance calculation routines."""
 
-from math import asin, cos, radians, sin, sqrt
+from __future__ import annotations
 
+from math import radians
+from typing import TYPE_CHECKING, Any
+
+from ._kernels import haversine_distance
 from .constants import WGS84
 from .vectors import GPSCoordinate
 
-__all__ = ("haversine",)
+if TYPE_CHECKING:
+    from numpy import ndarray
+
+__all__ = ("haversine", "haversine_many")
 
 
 def haversine(first: GPSCoordinate, second: GPSCoordinate, datum=WGS84) -> float:
@@ -19,12 +26,43 @@ def haversine(first: GPSCoordinate, second: GPSCoordinate, datum=WGS84) -> float
     Returns:
         the distance of the two points, in metres
     """
-    first_lat = radians(first.lat)
-    second_lat = radians(second.lat)
-    lat_diff = first_lat - second_lat
-    lon_diff = radians(first.lon - second.lon)
-    d = (
-        sin(lat_diff * 0.5) ** 2
-        + cos(first_lat) * cos(second_lat) * sin(lon_diff * 0.5) ** 2
+    return haversine_distance(
+        radians(first._lat),
+        radians(first._lon),
+        radians(second._lat),
+        radians(second._lon),
+        datum.MEAN_RADIUS_IN_METERS,
+    )
+
+
+def haversine_many(ref: GPSCoordinate, lats: Any, lons: Any, datum=WGS84) -> ndarray:
+    """Returns the distances of multiple points from a single reference point
+    using the Haversine formula, in a single vectorized pass. Requires NumPy.
+
+    Parameters:
+        ref: the reference point
+        lats: the latitudes of the points, in degrees
+        lons: the longitudes of the points, in degrees
+
+    Returns:
+        the distances of the points from the reference point, in metres, as a
+        NumPy array with the same shape as the broadcast latitudes and
+        longitudes
+    """
+    from .arrays import _numpy
+
+    np = _numpy()
+
+    # The scalar kernel broadcasts over arrays if we substitute the NumPy
+    # equivalents of the math functions
+    return haversine_distance(
+        np.radians(lats),
+        np.radians(lons),
+        radians(ref._lat),
+        radians(ref._lon),
+        datum.MEAN_RADIUS_IN_METERS,
+        _asin=np.arcsin,
+        _cos=np.cos,
+        _sin=np.sin,
+        _sqrt=np.sqrt,
     )
-    return 2 * datum.MEAN_RADIUS_IN_METERS * asin(sqrt(d))
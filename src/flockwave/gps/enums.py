@@ -1,39 +1,35 @@
-from __future__ import annotations
-
 from enum import Enum
 
 __all__ = ("GNSSType",)
 
 
-_gnss_type_to_string: dict[GNSSType, str] = {}
-
-
 class GNSSType(Enum):
     """Enum representing the known Global Navigation Satellite Systems of the
     world.
     """
 
+    _description: str
+
+    def __new__(cls, value: str, description: str):
+        # Each member stores its human-readable description next to its value
+        # so describe() does not need a separate lookup table
+        obj = object.__new__(cls)
+        obj._value_ = value
+        obj._description = description
+        return obj
+
     # The order below reflects the order of these satellite systems in the
     # RTCM3 MSM message list; e.g., 1087 is GPS MSM7, 1097 is GLONASS MSM7,
     # 1107 is Galileo MSM7 and so on
 
-    GPS = "gps"
-    GLONASS = "glonass"
-    GALILEO = "galileo"
-    SBAS = "sbas"
-    QZSS = "qzss"
-    BEIDOU = "beidou"
-    IRNSS = "irnss"
+    GPS = "gps", "GPS"
+    GLONASS = "glonass", "GLONASS"
+    GALILEO = "galileo", "Galileo"
+    SBAS = "sbas", "SBAS"
+    QZSS = "qzss", "QZSS"
+    BEIDOU = "beidou", "BeiDou"
+    IRNSS = "irnss", "IRNSS"
 
     def describe(self) -> str:
-        result = _gnss_type_to_string.get(self)
-        return result or f"unknown GNSS type: {self!r}"
-
-
-_gnss_type_to_string[GNSSType.GPS] = "GPS"
-_gnss_type_to_string[GNSSType.GLONASS] = "GLONASS"
-_gnss_type_to_string[GNSSType.GALILEO] = "Galileo"
-_gnss_type_to_string[GNSSType.SBAS] = "SBAS"
-_gnss_type_to_string[GNSSType.QZSS] = "QZSS"
-_gnss_type_to_string[GNSSType.BEIDOU] = "BeiDou"
-_gnss_type_to_string[GNSSType.IRNSS] = "IRNSS"
+        """Returns a human-readable description of the satellite system."""
+        return self._description
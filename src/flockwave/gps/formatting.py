@@ -16,6 +16,24 @@ __all__ = (
     "format_longitude_for_nmea_gga_message",
 )
 
+_GGA_FIX_INFO = ("1", "10", "1")
+"""Fixed fix type, number of satellites and HDOP fields of the GGA messages
+that we generate.
+"""
+
+_GGA_TRAILER = (
+    # Unit of altitude
+    "M",
+    # Height of geoid, always null
+    "",
+    # Unit of height of geoid, always null
+    "",
+    # Age of RTK corrections, station ID
+    "0.0",
+    "0000",
+)
+"""Fixed fields following the altitude in the GGA messages that we generate."""
+
 
 def format_gps_coordinate(coord: GPSCoordinate) -> str:
     """Formats a GPS coordinate in a human-readable way."""
@@ -29,32 +47,25 @@ def format_gps_coordinate_as_nmea_gga_message(
     if time is None:
         time = datetime.now(timezone.utc)
 
-    alt = coord.amsl if coord.amsl is not None else 0.0
+    amsl = coord._amsl
+    alt = amsl if amsl is not None else 0.0
 
     packet = create_nmea_packet(
         "GP",
         "GGA",
         (
-            # Time in HHMMSS format
-            time.strftime("%H%M%S") + f".{int(time.microsecond // 10000):02}",
+            # Time in HHMMSS.SS format
+            f"{time.hour:02}{time.minute:02}{time.second:02}"
+            f".{time.microsecond // 10000:02}",
             # Latitude and latitude sign
-            *format_latitude_for_nmea_gga_message(coord.lat),
+            *format_latitude_for_nmea_gga_message(coord._lat),
             # Longitude and longitude sign
-            *format_longitude_for_nmea_gga_message(coord.lon),
+            *format_longitude_for_nmea_gga_message(coord._lon),
             # Fix type, number of satellites, HDOP
-            "1",
-            "10",
-            "1",
+            *_GGA_FIX_INFO,
             # Altitude
             f"{alt:.2f}",
-            "M",
-            # Height of geoid, always null
-            "",
-            # Unit of height of geoid, always null
-            "",
-            # Age of RTK corrections, station ID
-            "0.0",
-            "0000",
+            *_GGA_TRAILER,
         ),
     )
     return packet.render(newline=True)
@@ -69,9 +80,14 @@ def format_latitude_for_nmea_gga_message(lat: float) -> tuple[str, str]:
     Returns:
         the formatted coordinate and the sign (North or South)
     """
-    sign = "S" if lat < 0 else "N"
-    deg, min_frac = divmod(abs(lat), 1)
-    return f"{int(deg):02}{min_frac * 60:07.4f}", sign
+    if lat < 0:
+        sign, lat = "S", -lat
+    else:
+        sign = "N"
+    # Rounding to ten-thousandths of a minute in integer arithmetic first
+    # ensures that the minutes are never rounded up to 60 when formatting
+    deg, rem = divmod(int(lat * 600000 + 0.5), 600000)
+    return f"{deg:02}{rem / 10000:07.4f}", sign
 
 
 def format_longitude_for_nmea_gga_message(lon: float) -> tuple[str, str]:
@@ -83,6 +99,10 @@ def format_longitude_for_nmea_gga_message(lon: float) -> tuple[str, str]:
     Returns:
         the formatted coordinate and the sign (East or West)
     """
-    sign = "W" if lon < 0 else "E"
-    deg, min_frac = divmod(abs(lon), 1)
-    return f"{int(deg):03}{min_frac * 60:07.4f}", sign
+    if lon < 0:
+        sign, lon = "W", -lon
+    else:
+        sign = "E"
+    # See format_latitude_for_nmea_gga_message() for the rationale
+    deg, rem = divmod(int(lon * 600000 + 0.5), 600000)
+    return f"{deg:03}{rem / 10000:07.4f}", sign
@@ -4,10 +4,12 @@ normal byte stream.
 
 from abc import ABCMeta, abstractmethod
 from enum import Enum
-from typing import Optional
 
 __all__ = ("NullDechunker", "ResponseDechunker")
 
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+"""Bytes that may appear in the chunk length header."""
+
 
 class ResponseDechunkerState(Enum):
     START = "START"
@@ -23,6 +25,16 @@ class Dechunker(metaclass=ABCMeta):
     def feed(self, data: bytes) -> bytes:
         raise NotImplementedError
 
+    def feed_into(self, data: bytes, out: bytearray) -> None:
+        """Feeds some bytes into the dechunker object and appends the
+        dechunked data to the given buffer.
+
+        Parameters:
+            data: the bytes to feed into the dechunker
+            out: the buffer to append the dechunked data to
+        """
+        out += self.feed(data)
+
 
 class NullDechunker(Dechunker):
     """Null dechunker that is suitable for un-chunked HTTP responses."""
@@ -38,14 +50,27 @@ class NullDechunker(Dechunker):
         """
         return data
 
+    def feed_into(self, data: bytes, out: bytearray) -> None:
+        """Appends the bytes fed into the dechunker to the given buffer
+        without changes.
+
+        Parameters:
+            data: the bytes to feed into the dechunker
+            out: the buffer to append the bytes to
+        """
+        out += data
+
 
 class ResponseDechunker(Dechunker):
     """Merges the chunks of a HTTP response that is streamed using chunked
     transfer encoding.
     """
 
+    _out: bytearray
+
     def __init__(self):
         """Constructor."""
+        self._out = bytearray()
         self.reset()
 
     def feed(self, data: bytes) -> bytes:
@@ -58,61 +83,84 @@ class ResponseDechunker(Dechunker):
         Returns:
             bytes: the dechunked data
         """
-        result: list[int] = []
-        for byte in data:
-            byte = self._feed_byte(byte)
-            if byte is not None:
-                result.append(byte)
-        return bytes(result)
+        # The output buffer is re-used across calls to spare an allocation
+        out = self._out
+        out.clear()
+        self.feed_into(data, out)
+        return bytes(out)
+
+    def feed_into(self, data: bytes, out: bytearray) -> None:
+        """Feeds some bytes into the dechunker object and appends the
+        dechunked data to the given buffer.
+
+        Parameters:
+            data: the bytes to feed into the dechunker
+            out: the buffer to append the dechunked data to
+        """
+        # The data is processed in slices instead of byte by byte; the body of
+        # each chunk is copied with a single slicing operation
+        view = memoryview(data)
+        cursor, length = 0, len(data)
+
+        while cursor < length:
+            state = self._state
+            if state is ResponseDechunkerState.START:
+                index = data.find(b"\r", cursor)
+                end = index if index >= 0 else length
+                if end > cursor:
+                    self._feed_header_digits(data[cursor:end])
+                if index < 0:
+                    break
+                self._state = ResponseDechunkerState.HEADER_ENDING
+                cursor = index + 1
+            elif state is ResponseDechunkerState.HEADER_ENDING:
+                self._expect_byte(data[cursor], 10)
+                if self._chunk_length > 0:
+                    self._state = ResponseDechunkerState.BODY
+                else:
+                    self._state = ResponseDechunkerState.START
+                cursor += 1
+            elif state is ResponseDechunkerState.BODY:
+                if self._chunk_length > 0:
+                    end = min(cursor + self._chunk_length, length)
+                    out += view[cursor:end]
+                    self._chunk_length -= end - cursor
+                    cursor = end
+                else:
+                    self._expect_byte(data[cursor], 13)
+                    self._state = ResponseDechunkerState.BODY_ENDING
+                    cursor += 1
+            elif state is ResponseDechunkerState.BODY_ENDING:
+                self._expect_byte(data[cursor], 10)
+                self.reset()
+                cursor += 1
+            else:
+                raise ValueError("invalid decoder state: {0!r}".format(self._state))
 
     def reset(self) -> None:
         """Resets the dechunker to its ground state."""
-        self._current_chunk = []
         self._chunk_length = 0
         self._state = ResponseDechunkerState.START
 
-    def _feed_byte(self, byte: int) -> Optional[int]:
-        if self._state == ResponseDechunkerState.START:
-            if byte == 13:
-                self._state = ResponseDechunkerState.HEADER_ENDING
-            else:
-                try:
-                    self._chunk_length = (self._chunk_length << 4) + int(chr(byte), 16)
-                except ValueError:
-                    raise ValueError(
-                        "chunked transfer encoding protocol "
-                        "violation; got char with code {0} when expecting a "
-                        "hexadecimal number".format(byte)
-                    ) from None
-        elif self._state == ResponseDechunkerState.HEADER_ENDING:
-            if byte != 10:
-                raise ValueError(
-                    "chunked transfer encoding protocol "
-                    "violation; got char with code {0} when expecting 10".format(byte)
-                )
-            if self._chunk_length > 0:
-                self._state = ResponseDechunkerState.BODY
-            else:
-                self._state = ResponseDechunkerState.START
-        elif self._state == ResponseDechunkerState.BODY:
-            if self._chunk_length > 0:
-                self._chunk_length -= 1
-                return byte
-            else:
-                if byte != 13:
-                    raise ValueError(
-                        "chunked transfer encoding protocol "
-                        "violation; got char with code {0!r} when expecting "
-                        "13".format(byte)
-                    )
-                self._state = ResponseDechunkerState.BODY_ENDING
-        elif self._state == ResponseDechunkerState.BODY_ENDING:
-            if byte != 10:
-                raise ValueError(
-                    "chunked transfer encoding protocol "
-                    "violation; got char with code {0!r} when expecting "
-                    "10".format(byte)
-                )
-            self.reset()
-        else:
-            raise ValueError("invalid decoder state: {0!r}".format(self._state))
+    def _feed_header_digits(self, digits: bytes) -> None:
+        """Processes a run of bytes from the chunk length header, which must
+        consist of hexadecimal digits only.
+        """
+        invalid = digits.translate(None, _HEX_DIGITS)
+        if invalid:
+            raise ValueError(
+                "chunked transfer encoding protocol "
+                "violation; got char with code {0} when expecting a "
+                "hexadecimal number".format(invalid[0])
+            )
+        self._chunk_length = (self._chunk_length << (4 * len(digits))) + int(digits, 16)
+
+    @staticmethod
+    def _expect_byte(byte: int, expected: int) -> None:
+        """Ensures that the given byte is equal to the expected one."""
+        if byte != expected:
+            raise ValueError(
+                "chunked transfer encoding protocol "
+                "violation; got char with code {0} when expecting "
+                "{1}".format(byte, expected)
+            )
@@ -1,8 +1,7 @@
 """Simple HTTP request object for the low-level HTTP library."""
 
-from io import BytesIO
-from typing import Optional, OrderedDict
-from urllib.parse import quote, urlparse
+from typing import Optional
+from urllib.parse import ParseResultBytes, quote, urlparse
 
 from .response import Response
 
@@ -15,9 +14,13 @@ class Request:
     data: Optional[bytes]
     """The data to send in the body of the HTTP request."""
 
-    headers: OrderedDict[str, bytes]
+    headers: dict[str, bytes]
     """The headers to send with the HTTP request."""
 
+    _url: bytes
+    _parts: ParseResultBytes
+    _request_line: bytes
+
     def __init__(
         self,
         url: bytes,
@@ -35,10 +38,25 @@ class Request:
         """
         self.url = url
         self.data = data
-        self.headers = OrderedDict()
+        self.headers = {}
         for key, value in (headers or {}).items():
             self.add_header(key, value)
 
+    @property
+    def url(self) -> bytes:
+        """The URL to load."""
+        return self._url
+
+    @url.setter
+    def url(self, value: bytes) -> None:
+        # The URL is parsed and the request line is assembled only when the
+        # URL changes, not every time the request is sent
+        self._url = value
+        self._parts = urlparse(value)
+        self._request_line = "GET {0} HTTP/1.1\r\n".format(
+            quote(self._parts.path)
+        ).encode("ascii")
+
     def add_header(self, key: str, val: bytes) -> None:
         """Adds an HTTP header to the request.
 
@@ -74,8 +92,7 @@ class Request:
         if self.data is not None:
             raise NotImplementedError("POST requests not supported yet")
 
-        method = "GET"
-        parts = urlparse(self.url)
+        parts = self._parts
 
         if not self.has_header("Host"):
             assert parts.hostname is not None
@@ -91,23 +108,18 @@ class Request:
         if not self.has_header("Connection"):
             self.add_header("Connection", b"close")
 
-        request = BytesIO()
-        request.write(
-            "{0} {1} HTTP/1.1\r\n".format(method, quote(parts.path)).encode("ascii")
-        )
+        lines = [self._request_line]
         for header, value in self.headers.items():
-            header = header.encode("ascii")
-            if header == b"User-agent":
+            if header == "User-agent":
                 # Some buggy NTRIP servers don't recognize User-agent so we
                 # spell it like this
-                header = b"User-Agent"
-            request.write(header)
-            request.write(b": ")
-            request.write(value)
-            request.write(b"\r\n")
-        request.write(b"\r\n")
+                name = b"User-Agent"
+            else:
+                name = header.encode("ascii")
+            lines.append(b"%s: %s\r\n" % (name, value))
+        lines.append(b"\r\n")
 
         stream = await open_tcp_stream(parts.hostname, parts.port)
-        await stream.send_all(request.getvalue())
+        await stream.send_all(b"".join(lines))
 
         return Response(stream)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Generator, Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from .dechunkers import Dechunker, NullDechunker, ResponseDechunker
 from .errors import (
@@ -18,6 +18,16 @@ if TYPE_CHECKING:
 __all__ = ("Response",)
 
 
+_ERRORS_BY_STATUS_CODE: dict[bytes, tuple[type[ResponseError], str]] = {
+    b"401": (AuthenticationNeededError, "Authentication needed"),
+    b"403": (AccessDeniedError, "Access denied"),
+    b"404": (NotFoundError, "Not found"),
+}
+"""Exception classes and messages to use for HTTP status codes that have a
+dedicated exception class.
+"""
+
+
 class LineReader:
     """Helper object for Trio that takes a ReceiveStream and parses lines
     out of it.
@@ -25,54 +35,43 @@ class LineReader:
 
     stream: ReceiveStream
     _buffer: bytearray
-    _line_generator: Generator[Optional[bytes], Optional[bytes], None]
+    _max_line_length: int
 
     def __init__(self, stream: ReceiveStream, max_line_length: int = 16384):
         self.stream = stream
 
         self._buffer = bytearray()
-        self._line_generator = self.generate_lines(max_line_length, self._buffer)
+        self._max_line_length = max_line_length
+
+    def get_remainder(self) -> bytes:
+        return bytes(self._buffer)
 
-    @staticmethod
-    def generate_lines(
-        max_line_length: int, buffer: bytearray
-    ) -> Generator[Optional[bytes], Optional[bytes], None]:
-        buf = buffer or bytearray()
+    async def readline(self) -> bytes:
+        buf = self._buffer
         find_start = 0
         while True:
             newline_idx = buf.find(b"\n", find_start)
-            if newline_idx < 0:
-                # no b'\n' found in buf
-                if len(buf) > max_line_length:
-                    raise ValueError("line too long")
-                # next time, start the search where this one left off
-                find_start = len(buf)
-                more_data = yield
-            else:
+            if newline_idx >= 0:
                 # b'\n' found in buf so return the line and move up buf
-                line = buf[: newline_idx + 1]
+                line = bytes(buf[: newline_idx + 1])
                 # Update the buffer in place, to take advantage of bytearray's
                 # optimized delete-from-beginning feature.
                 del buf[: newline_idx + 1]
-                # next time, start the search from the beginning
-                find_start = 0
-                more_data = yield line
-
-            if more_data is not None:
-                buf += bytes(more_data)
-
-    def get_remainder(self) -> bytes:
-        self._line_generator.close()
-        return bytes(self._buffer)
-
-    async def readline(self) -> bytes:
-        line = next(self._line_generator)
-        while line is None:
-            more_data = await self.stream.receive_some(1024)
+                return line
+
+            # no b'\n' found in buf
+            if len(buf) > self._max_line_length:
+                raise ValueError("line too long")
+
+            # next time, start the search where this one left off. The read
+            # size is large enough for the headers of a typical response to
+            # arrive in a single read; any excess is returned as the start
+            # of the body after the headers are processed
+            find_start = len(buf)
+            more_data = await self.stream.receive_some(4096)
             if not more_data:
                 return b""  # this is the EOF indication expected by my caller
-            line = self._line_generator.send(more_data)
-        return line
+            buf += more_data
 
 
 class Response:
@@ -81,7 +80,7 @@ class Response:
     """
 
     _stream: Stream
-    _pushback_stream: ReceiveStream
+    _leftover: bytes
     _headers: Optional[dict[str, bytes]]
     _protocol: Optional[bytes]
     _dechunker: Optional[Dechunker]
@@ -93,6 +92,7 @@ class Response:
             stream: the stream to read the response from
         """
         self._stream = stream
+        self._leftover = b""
 
         self._headers = None
         self._protocol = None
@@ -119,13 +119,11 @@ class Response:
 
         self._protocol = parts[0]
         code = parts[1]
-        if code == b"401":
-            raise AuthenticationNeededError("Authentication needed")
-        elif code == b"403":
-            raise AccessDeniedError("Access denied")
-        elif code == b"404":
-            raise NotFoundError("Not found")
-        elif code != b"200":
+        if code != b"200":
+            error = _ERRORS_BY_STATUS_CODE.get(code)
+            if error is not None:
+                error_class, message = error
+                raise error_class(message)
             raise ResponseError("Received HTTP response: {0!r}".format(code))
 
         if self._protocol != b"ICY":
@@ -143,10 +141,9 @@ class Response:
 
                 self._headers[key.decode("ascii").capitalize()] = value.lstrip()
 
-        from ._lazy_deps import PushbackStreamWrapper
-
-        self._pushback_stream = PushbackStreamWrapper(self._stream)
-        self._pushback_stream.push_back(line_reader.get_remainder())
+        # Bytes that the line reader has read beyond the headers belong to
+        # the body; receive_some() returns them before reading the stream
+        self._leftover = line_reader.get_remainder()
 
     def _process_headers(self):
         if self.getheader("Transfer-Encoding") == b"chunked":
@@ -212,7 +209,12 @@ class Response:
 
         block_size = 4096
         bytes_left = max_bytes if max_bytes is not None else None
-        result = []
+        result = bytearray()
+
+        # Unchunked responses do not need to go through the dechunker at all
+        dechunker = self._dechunker
+        if isinstance(dechunker, NullDechunker):
+            dechunker = None
 
         while True:
             if bytes_left is None:
@@ -220,27 +222,44 @@ class Response:
             else:
                 to_read = min(bytes_left, block_size)
 
-            chunk = await self._pushback_stream.receive_some(to_read)
+            leftover = self._leftover
+            if leftover:
+                chunk = leftover[:to_read]
+                self._leftover = leftover[to_read:]
+            else:
+                chunk = await self._stream.receive_some(to_read)
             if not chunk:
                 break
 
-            if self._dechunker is not None:
-                chunk = self._dechunker.feed(chunk)
+            if dechunker is not None:
+                # The dechunker appends directly to the result so the
+                # dechunked data is not copied twice
+                length_before = len(result)
+                dechunker.feed_into(chunk, result)
+                chunk_length = len(result) - length_before
 
                 # At this point it may happen that we are handed an empty
                 # chunk from the dechunker. It does not mean EOF so we need to
                 # continue with the next iteration.
-                if not chunk:
+                if not chunk_length:
                     continue
+            else:
+                chunk_length = len(chunk)
+                if chunk_length < to_read and not result:
+                    # Most reads are satisfied by a single receive; the
+                    # received bytes can be returned without copying them
+                    return chunk
+                result += chunk
 
-            result.append(chunk)
             if bytes_left is not None:
-                bytes_left -= len(chunk)
+                bytes_left -= chunk_length
+                if bytes_left <= 0:
+                    break
 
-            if len(chunk) < to_read:
+            if chunk_length < to_read:
                 break
 
-        return b"".join(result)
+        return bytes(result)
 
     async def send_all(self, data: bytes) -> None:
         """Sends the given bytes to the server while the response is still
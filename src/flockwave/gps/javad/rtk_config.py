@@ -18,12 +18,6 @@ class JavadRTKBaseConfigurator(RTKBaseConfigurator):
     of the RTK survey settings will be ignored.
     """
 
-    settings: RTKSurveySettings
-
-    def __init__(self, settings: RTKSurveySettings):
-        """Constructor."""
-        self.settings = settings
-
     async def run(
         self,
         write: Callable[[bytes], Awaitable[None]],
@@ -52,6 +46,29 @@ class JavadRTKBaseConfigurator(RTKBaseConfigurator):
                 value = str(value)
             await send(f"set,{key},{value}")
 
+        # Each GNSS type is checked in more than one place below
+        uses_gnss = self.settings.uses_gnss
+        (
+            uses_gps,
+            uses_glonass,
+            uses_galileo,
+            uses_sbas,
+            uses_qzss,
+            uses_beidou,
+            uses_irnss,
+        ) = (
+            uses_gnss(gnss_type)
+            for gnss_type in (
+                GNSSType.GPS,
+                GNSSType.GLONASS,
+                GNSSType.GALILEO,
+                GNSSType.SBAS,
+                GNSSType.QZSS,
+                GNSSType.BEIDOU,
+                GNSSType.IRNSS,
+            )
+        )
+
         # Disable all messages on the current port
         await send("dm,/cur/term")
 
@@ -71,19 +88,19 @@ class JavadRTKBaseConfigurator(RTKBaseConfigurator):
         # system if it was enabled by the user; this is intentional as the user
         # might want to _track_ certain satellites for calculating the position
         # but does not want to send RTK corrections based on them
-        if self.settings.uses_gnss(GNSSType.GPS):
+        if uses_gps:
             await set("/par/pos/sys/gps", "y")
-        if self.settings.uses_gnss(GNSSType.GLONASS):
+        if uses_glonass:
             await set("/par/pos/sys/glo", "y")
-        if self.settings.uses_gnss(GNSSType.GALILEO):
+        if uses_galileo:
             await set("/par/pos/sys/gal", "y")
-        if self.settings.uses_gnss(GNSSType.SBAS):
+        if uses_sbas:
             await set("/par/pos/sys/sbas", "y")
-        if self.settings.uses_gnss(GNSSType.QZSS):
+        if uses_qzss:
             await set("/par/pos/sys/qzss", "y")
-        if self.settings.uses_gnss(GNSSType.BEIDOU):
+        if uses_beidou:
             await set("/par/pos/sys/comp", "y")
-        if self.settings.uses_gnss(GNSSType.IRNSS):
+        if uses_irnss:
             await set("/par/pos/sys/irnss", "y")
 
         # Do not use fixed altitude
@@ -95,18 +112,18 @@ class JavadRTKBaseConfigurator(RTKBaseConfigurator):
             offset = 7
         else:
             offset = 4
-        if self.settings.uses_gnss(GNSSType.GPS):
+        if uses_gps:
             msg_intervals[1070 + offset] = 1
-        if self.settings.uses_gnss(GNSSType.GLONASS):
+        if uses_glonass:
             msg_intervals[1080 + offset] = 1
             msg_intervals[1230] = 5
-        if self.settings.uses_gnss(GNSSType.GALILEO):
+        if uses_galileo:
             msg_intervals[1090 + offset] = 1
-        if self.settings.uses_gnss(GNSSType.SBAS):
+        if uses_sbas:
             msg_intervals[1100 + offset] = 1
-        if self.settings.uses_gnss(GNSSType.QZSS):
+        if uses_qzss:
             msg_intervals[1110 + offset] = 1
-        if self.settings.uses_gnss(GNSSType.BEIDOU):
+        if uses_beidou:
             msg_intervals[1120 + offset] = 1
         msg_spec = ",".join(
             str(msg_id) if interval == 1 else f"{msg_id}:{interval}"
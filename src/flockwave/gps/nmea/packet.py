@@ -8,6 +8,13 @@ from pynmea2 import NMEASentence as NMEAPacket
 __all__ = ("NMEAPacket", "create_talker_sentence", "create_nmea_packet")
 
 
+_talker_sentence_factories: dict[str, Any] = pynmea2.TalkerSentence.sentence_types
+"""Mapping from the canonical (uppercase) NMEA sentence types to the
+corresponding sentence classes of ``pynmea2``. This is the registry of
+``pynmea2`` itself so sentence classes registered later are also found.
+"""
+
+
 @lru_cache()
 def _sentence_factory_from_type(type: str):
     if not type or "_" in type:
@@ -24,7 +31,11 @@ def create_talker_sentence(talker: str, type: str, args: Sequence[Any]) -> NMEAP
     """Creates an NMEA talker sentence with the given talker ID, packet type
     and arguments.
     """
-    factory = _sentence_factory_from_type(type)
+    # Canonical sentence types are resolved with a single dict lookup; the
+    # cached, validating lookup is needed only for everything else
+    factory = _talker_sentence_factories.get(type)
+    if factory is None:
+        factory = _sentence_factory_from_type(type)
     return factory(talker, type, args)
 
 
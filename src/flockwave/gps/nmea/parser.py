@@ -1,50 +1,143 @@
-from typing import Callable, Iterable
+import re
 
-from .packet import NMEAPacket
+from functools import reduce
+from operator import xor
+from typing import Any, Callable, Iterable, Optional
+
+from .packet import NMEAPacket, _talker_sentence_factories
 
 __all__ = ("create_nmea_parser",)
 
 
+_TALKER_SENTENCE_TYPE = re.compile(rb"[A-Z0-9_]{5}")
+"""Regular expression matching the uppercased talker ID and sentence type of
+an NMEA talker sentence.
+"""
+
+_HEX_DIGITS = b"0123456789ABCDEF"
+"""Characters allowed in the checksum of an NMEA sentence."""
+
+_sentence_factories_by_type: dict[bytes, tuple[str, str, Any]] = {}
+"""Cache mapping the uppercased talker IDs and sentence types (e.g. ``GPGGA``)
+of talker sentences that were parsed successfully to the talker ID, the
+sentence type and the ``pynmea2`` class of the sentence.
+"""
+
+
+def _find_sentence_factory(sentence_type: bytes) -> Optional[tuple[str, str, Any]]:
+    """Returns the talker ID, the sentence type and the sentence class for an
+    uppercased talker ID and sentence type like ``GPGGA``, or ``None`` if
+    ``pynmea2`` has no talker sentence class for it.
+    """
+    if not _TALKER_SENTENCE_TYPE.fullmatch(sentence_type):
+        return None
+
+    talker = sentence_type[:2].decode("ascii")
+    sentence = sentence_type[2:].decode("ascii")
+    factory = _talker_sentence_factories.get(sentence)
+    return None if factory is None else (talker, sentence, factory)
+
+
+def _nmea_checksum(data: bytes) -> int:
+    """Returns the NMEA checksum of the given bytes, i.e. the XOR of all the
+    bytes between the ``$`` sign and the ``*`` sign of a sentence.
+
+    ``pynmea2`` validates checksums itself, but only as part of its regex-based
+    parser. The fast path of `_parse_sentence()` skips that parser for the
+    most common sentences, so it has to validate the checksum on its own.
+    """
+    return reduce(xor, data, 0)
+
+
+def _parse_sentence(line: bytes) -> NMEAPacket:
+    """Parses a single NMEA sentence without its trailing newline character.
+
+    Talker sentences with a valid checksum are constructed directly from
+    their fields; everything else is parsed by ``pynmea2``, which raises a
+    ValueError for invalid sentences.
+
+    Raises:
+        UnicodeDecodeError: if the sentence is not valid ASCII
+        ValueError: if the sentence is not a valid NMEA sentence
+    """
+    # Proprietary sentences ($P...) and queries (e.g. $CCGPQ,GGA) are
+    # matched differently by pynmea2 so they are left to the generic parser.
+    # pynmea2 ignores the case of the sentence type so we need to do the same
+    if (
+        line[:1] == b"$"
+        and line[6:7] == b","
+        and line[1:2] not in (b"P", b"p")
+        and line[5:6] not in (b"Q", b"q")
+    ):
+        sentence_type = line[1:6].upper()
+        entry = _sentence_factories_by_type.get(sentence_type)
+        cached = entry is not None
+        if not cached:
+            entry = _find_sentence_factory(sentence_type)
+
+        if entry is not None:
+            sentence_bytes = line.rstrip()
+            star = len(sentence_bytes) - 3
+            checksum = sentence_bytes[star + 1 :]
+            if (
+                star >= 7
+                and sentence_bytes[star] == 42  # "*"
+                and sentence_bytes.find(b"*", 7, star) < 0
+                and checksum.strip(_HEX_DIGITS) == b""
+                and _nmea_checksum(sentence_bytes[1:star]) == int(checksum, 16)
+            ):
+                # Only sentences with a valid checksum are cached so garbage
+                # on the input cannot grow the cache
+                if not cached:
+                    _sentence_factories_by_type[sentence_type] = entry
+
+                talker, sentence, factory = entry
+                fields = sentence_bytes[7:star].decode("ascii").split(",")
+                return factory(talker, sentence, fields)
+
+    return NMEAPacket.parse(line.decode("ascii"))
+
+
 class NMEAParser:
     """NMEA-0183 sentence parser."""
 
-    _buffer: list[bytes]
-    _total: int
+    _buffer: bytearray
+    """Incomplete sentence received at the end of the last chunk of data."""
 
     def __init__(self):
-        self._buffer = []
-        self._total = 0
+        self._buffer = bytearray()
 
     def feed(self, data: bytes) -> list[NMEAPacket]:
         result: list[NMEAPacket] = []
 
-        while data:
-            pre, sep, data = data.partition(b"\n")
-
-            self._buffer.append(pre)
-            self._total += len(pre)
-
-            if sep:
-                line = b"".join(self._buffer)
-                try:
-                    result.append(NMEAPacket.parse(line.decode("ascii")))
-                except UnicodeDecodeError:
-                    pass
-                except ValueError:
-                    pass
-
-                self.reset()
-
-            else:
-                if self._total > 82:
-                    # Exceeded max message length
-                    self.reset()
+        # A single split scans the data only once; all but the last part are
+        # complete lines
+        *lines, tail = data.split(b"\n")
+
+        buffer = self._buffer
+        for line in lines:
+            if buffer:
+                buffer += line
+                line = bytes(buffer)
+                buffer.clear()
+
+            try:
+                result.append(_parse_sentence(line))
+            except UnicodeDecodeError:
+                pass
+            except ValueError:
+                pass
+
+        if tail:
+            buffer += tail
+            if len(buffer) > 82:
+                # Exceeded max message length
+                buffer.clear()
 
         return result
 
     def reset(self) -> None:
         self._buffer.clear()
-        self._total = 0
 
 
 def create_nmea_parser() -> Callable[[bytes], Iterable[NMEAPacket]]:
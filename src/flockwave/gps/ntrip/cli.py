@@ -0,0 +1,166 @@
+"""Command line interface of the NTRIP client that copies a stream from an
+NTRIP caster into the standard output.
+"""
+
+from __future__ import annotations
+
+import click
+import sys
+
+from base64 import b64encode
+from typing import Awaitable, Callable, Optional
+
+from flockwave.gps.formatting import format_gps_coordinate_as_nmea_gga_message
+from flockwave.gps.vectors import GPSCoordinate
+
+from .client import NtripClient
+
+__all__ = ("ntrip_streamer",)
+
+
+@click.command()
+@click.argument("url")
+@click.option(
+    "-u",
+    "--username",
+    metavar="USERNAME",
+    default=None,
+    help="the username to use when connecting",
+)
+@click.option(
+    "-p",
+    "--password",
+    metavar="PASSWORD",
+    default=None,
+    help="the password to use when connecting",
+)
+@click.option(
+    "--format",
+    default="raw",
+    type=click.Choice(["raw", "hex", "json"]),
+    help=(
+        "the output format. 'raw' prints the raw bytes from the NTRIP server. "
+        "'hex' prints a hex dump of the raw bytes from the NTRIP server. "
+        "'json' prints the timestamped chunks received from the NTRIP server "
+        "in JSON format (chunks will be base64-encoded). This is useful for "
+        "replaying the stream later."
+    ),
+)
+@click.option(
+    "--coord",
+    default="",
+    type=str,
+    help=(
+        "coordinates to send in an NMEA GGA message to start the stream. "
+        "Comma-separated latitude, longitude and altitude, in decimal "
+        "format. Altitude is optional."
+    ),
+)
+def ntrip_streamer(
+    url: str,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    format: str = "raw",
+    coord: str = "",
+):
+    """Copies a stream from an NTRIP server directly into the standard
+    output.
+
+    The given URL must adhere to the following format:
+
+        [protocol://][username[:password]@]hostname/mountpoint
+
+    where 'protocol' is either 'ntrip' (for NTRIP v2 casters) or 'ntrip1'
+    (for NTRIP v1 casters), and it defaults to 'ntrip'. The username and the
+    password is optional.
+
+    Example servers to try (if you have the right username and password):
+    www.euref-ip.net/BUTE0, ntrip://ntrip.use-snip.com/RTCM3EPH,
+    ntrip1://152.66.6.49/RTCM23
+    """
+    from time import monotonic
+
+    try:
+        from trio import open_nursery, run, sleep, TASK_STATUS_IGNORED
+    except ImportError:
+        raise ImportError(
+            "You need to install 'trio' to use the NTRIP streamer"
+        ) from None
+
+    async def read_messages(
+        reader: Callable[[], Awaitable[bytes]], *, task_status=TASK_STATUS_IGNORED
+    ) -> None:
+        hexdump_table = bytes([i if i >= 32 and i < 127 else 46 for i in range(256)])
+        prev = monotonic()
+
+        task_status.started()
+
+        while True:
+            data = await reader()
+            if not data:
+                print("Stream ended.", file=sys.stderr)
+                break
+
+            if format == "hex":
+                # Convert the entire chunk in one go and slice the rows out of
+                # the result; each byte takes three characters in hex_digits
+                hex_digits = data.hex(" ")
+                printable = data.translate(hexdump_table).decode("ascii")
+                rows = [
+                    f"{start:08x}  {hex_digits[3 * start : 3 * start + 23]}  "
+                    f"{hex_digits[3 * start + 24 : 3 * start + 47]}".ljust(60)
+                    + f"|{printable[start : start + 16]}|\n"
+                    for start in range(0, len(data), 16)
+                ]
+                sys.stdout.write("".join(rows))
+
+            else:
+                if format == "json":
+                    now = monotonic()
+                    dt = int((now - prev) * 1000)
+                    prev = now
+
+                    # Same output as json.dumps() would give; neither of the
+                    # values needs escaping so the line can be assembled as
+                    # bytes directly
+                    data = b'{"dt": %d, "data": "%s"}\n' % (dt, b64encode(data))
+
+                sys.stdout.buffer.write(data)
+                sys.stdout.flush()
+
+    async def send_position(
+        coord: GPSCoordinate, sender: Callable[[bytes], Awaitable[None]]
+    ):
+        while True:
+            await sender(
+                format_gps_coordinate_as_nmea_gga_message(coord).encode("ascii")
+            )
+            await sleep(60)
+
+    async def main():
+        client = NtripClient.create(url, username=username, password=password)
+
+        stream = await client.get_stream()
+        print(f"Connected to {url}.", file=sys.stderr)
+
+        if coord:
+            parts = coord.split(",")
+            if len(parts) < 2 or len(parts) > 3:
+                raise RuntimeError(f"Invalid coordinate: {coord!r}")
+
+            lat, lon = parts[:2]
+            alt = float(parts[2]) if len(parts) > 2 else 0
+            coord_obj = GPSCoordinate(float(lat), float(lon), amsl=alt)
+        else:
+            coord_obj = None
+
+        async with open_nursery() as nursery:
+            await nursery.start(read_messages, stream.read)
+            if coord_obj:
+                nursery.start_soon(send_position, coord_obj, stream.write)
+
+    run(main)
+
+
+if __name__ == "__main__":
+    ntrip_streamer()
@@ -2,17 +2,13 @@
 
 from __future__ import annotations
 
-import click
-import sys
-
 from base64 import b64encode
 from dataclasses import dataclass, replace
-from typing import Awaitable, Callable, Optional, TYPE_CHECKING
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
 from urllib.parse import urlparse
 
-from flockwave.gps.formatting import format_gps_coordinate_as_nmea_gga_message
 from flockwave.gps.http import Request
-from flockwave.gps.vectors import GPSCoordinate
 
 if TYPE_CHECKING:
     from flockwave.gps.http import Response
@@ -46,25 +42,38 @@ class NtripClientConnectionInfo:
 
             ntrip1://[<username>:<password>]@<host>:[<port>][/<mountpoint>]
         """
-        if uri.startswith("ntrip1"):
-            parts = urlparse(uri, scheme="ntrip1")
-            version = 1
-        else:
-            parts = urlparse(uri, scheme="ntrip")
-            version = 2
+        host, port, username, password, mountpoint, version = _parse_ntrip_uri(uri)
+        return cls(host, port, username, password, mountpoint, version)
+
 
-        fake_uri = "http://" + parts.netloc + parts.path
-        parts = urlparse(fake_uri, scheme="http")
+@lru_cache(maxsize=128)
+def _parse_ntrip_uri(
+    uri: str,
+) -> tuple[str, int, Optional[str], Optional[str], Optional[str], int]:
+    """Parses an NTRIP URI into its host, port, username, password, mountpoint
+    and protocol version.
 
-        params = {
-            "host": parts.hostname,
-            "port": parts.port or 2101,
-            "username": parts.username,
-            "password": parts.password,
-            "mountpoint": parts.path[1:] if len(parts.path) > 1 else None,
-            "version": version,
-        }
-        return cls(**params)
+    The result is cached as clients that reconnect often create their
+    connection info objects from the same URI over and over again.
+    """
+    if uri.startswith("ntrip1"):
+        parts = urlparse(uri, scheme="ntrip1")
+        version = 1
+    else:
+        parts = urlparse(uri, scheme="ntrip")
+        version = 2
+
+    fake_uri = "http://" + parts.netloc + parts.path
+    parts = urlparse(fake_uri, scheme="http")
+
+    return (
+        parts.hostname,  # type: ignore
+        parts.port or 2101,
+        parts.username,
+        parts.password,
+        parts.path[1:] if len(parts.path) > 1 else None,
+        version,
+    )
 
 
 class NtripClient:
@@ -72,6 +81,10 @@ class NtripClient:
     caster.
     """
 
+    connection_info: NtripClientConnectionInfo
+    _authorization: Optional[tuple[str, Optional[str], bytes]]
+    _urls: dict[tuple[str, int, Optional[str]], bytes]
+
     @classmethod
     def create(
         cls,
@@ -129,6 +142,8 @@ class NtripClient:
             connection_info: an object describing how to connect to the server
         """
         self.connection_info = connection_info
+        self._authorization = None
+        self._urls = {}
 
     async def get_stream(
         self, mountpoint: Optional[str] = None, timeout: float = 10
@@ -154,12 +169,9 @@ class NtripClient:
         if self.connection_info.version == 2:
             request.add_header("Ntrip-Version", b"Ntrip/2.0")
 
-        if self.connection_info.username is not None:
-            credentials = b64encode(
-                "{0.username}:{0.password}".format(self.connection_info).encode("utf-8")
-            )
-            credentials = credentials.replace(b"\n", b"")
-            request.add_header("Authorization", b"Basic " + credentials)
+        authorization = self._get_authorization_header()
+        if authorization is not None:
+            request.add_header("Authorization", authorization)
 
         response = await request.send()
         await response.ensure_headers_processed()
@@ -179,6 +191,28 @@ class NtripClient:
                 "expected Content-type: gnss/data, got {0!r}".format(observed_value)
             )
 
+    def _get_authorization_header(self) -> Optional[bytes]:
+        """Returns the value of the ``Authorization`` header to send to the
+        server, or ``None`` if no username was given in the connection info.
+
+        The header is cached for the current username and password so clients
+        that reconnect often do not need to re-encode the credentials.
+        """
+        username = self.connection_info.username
+        if username is None:
+            return None
+
+        password = self.connection_info.password
+        if self._authorization is not None:
+            cached_username, cached_password, header = self._authorization
+            if cached_username == username and cached_password == password:
+                return header
+
+        credentials = b64encode(f"{username}:{password}".encode("utf-8"))
+        header = b"Basic " + credentials
+        self._authorization = username, password, header
+        return header
+
     def _url_for_mountpoint(self, mountpoint: Optional[str] = None) -> bytes:
         """Returns the URL of the given mountpoint.
 
@@ -190,162 +224,15 @@ class NtripClient:
         Returns:
             the URL of the given mountpoint
         """
-        mountpoint = mountpoint or self.connection_info.mountpoint
-        return f"http://{self.connection_info.host}:{self.connection_info.port}/{mountpoint}".encode(
-            "ascii"
-        )
-
-
-@click.command()
-@click.argument("url")
-@click.option(
-    "-u",
-    "--username",
-    metavar="USERNAME",
-    default=None,
-    help="the username to use when connecting",
-)
-@click.option(
-    "-p",
-    "--password",
-    metavar="PASSWORD",
-    default=None,
-    help="the password to use when connecting",
-)
-@click.option(
-    "--format",
-    default="raw",
-    type=click.Choice(["raw", "hex", "json"]),
-    help=(
-        "the output format. 'raw' prints the raw bytes from the NTRIP server. "
-        "'hex' prints a hex dump of the raw bytes from the NTRIP server. "
-        "'json' prints the timestamped chunks received from the NTRIP server "
-        "in JSON format (chunks will be base64-encoded). This is useful for "
-        "replaying the stream later."
-    ),
-)
-@click.option(
-    "--coord",
-    default="",
-    type=str,
-    help=(
-        "coordinates to send in an NMEA GGA message to start the stream. "
-        "Comma-separated latitude, longitude and altitude, in decimal "
-        "format. Altitude is optional."
-    ),
-)
-def ntrip_streamer(
-    url: str,
-    username: Optional[str] = None,
-    password: Optional[str] = None,
-    format: str = "raw",
-    coord: str = "",
-):
-    """Copies a stream from an NTRIP server directly into the standard
-    output.
-
-    The given URL must adhere to the following format:
-
-        [protocol://][username[:password]@]hostname/mountpoint
-
-    where 'protocol' is either 'ntrip' (for NTRIP v2 casters) or 'ntrip1'
-    (for NTRIP v1 casters), and it defaults to 'ntrip'. The username and the
-    password is optional.
-
-    Example servers to try (if you have the right username and password):
-    www.euref-ip.net/BUTE0, ntrip://ntrip.use-snip.com/RTCM3EPH,
-    ntrip1://152.66.6.49/RTCM23
-    """
-    from json import dumps
-    from time import monotonic
-
-    try:
-        from trio import open_nursery, run, sleep, TASK_STATUS_IGNORED
-    except ImportError:
-        raise ImportError(
-            "You need to install 'trio' to use the NTRIP streamer"
-        ) from None
-
-    async def read_messages(
-        reader: Callable[[], Awaitable[bytes]], *, task_status=TASK_STATUS_IGNORED
-    ) -> None:
-        hexdump_table = bytes([i if i >= 32 and i < 127 else 46 for i in range(256)])
-        prev = monotonic()
-
-        task_status.started()
-
-        while True:
-            data = await reader()
-            if not data:
-                print("Stream ended.", file=sys.stderr)
-                break
-
-            if format == "json":
-                now = monotonic()
-                dt = int((now - prev) * 1000)
-                data = (
-                    dumps({"dt": dt, "data": b64encode(data).decode("ascii")}).encode(
-                        "ascii"
-                    )
-                    + b"\n"
-                )
-                prev = now
-
-            elif format == "hex":
-                for start in range(0, len(data), 16):
-                    parts = [
-                        f"{start:08x}  ",
-                        data[start : start + 8].hex(" "),
-                        "  ",
-                        data[start + 8 : start + 16].hex(" "),
-                    ]
-
-                    sys.stdout.write("".join(parts).ljust(60))
-                    sys.stdout.write("|")
-                    sys.stdout.write(
-                        data[start : start + 16]
-                        .translate(hexdump_table)
-                        .decode("ascii")
-                    )
-                    sys.stdout.write("|\n")
-
-            else:
-                sys.stdout.buffer.write(data)
-                sys.stdout.flush()
-
-    async def send_position(
-        coord: GPSCoordinate, sender: Callable[[bytes], Awaitable[None]]
-    ):
-        while True:
-            await sender(
-                format_gps_coordinate_as_nmea_gga_message(coord).encode("ascii")
-            )
-            await sleep(60)
-
-    async def main():
-        client = NtripClient.create(url, username=username, password=password)
-
-        stream = await client.get_stream()
-        print(f"Connected to {url}.", file=sys.stderr)
-
-        if coord:
-            parts = coord.split(",")
-            if len(parts) < 2 or len(parts) > 3:
-                raise RuntimeError(f"Invalid coordinate: {coord!r}")
-
-            lat, lon = parts[:2]
-            alt = float(parts[2]) if len(parts) > 2 else 0
-            coord_obj = GPSCoordinate(float(lat), float(lon), amsl=alt)
-        else:
-            coord_obj = None
-
-        async with open_nursery() as nursery:
-            await nursery.start(read_messages, stream.read)
-            if coord_obj:
-                nursery.start_soon(send_position, coord_obj, stream.write)
-
-    run(main)
+        info = self.connection_info
+        key = info.host, info.port, mountpoint or info.mountpoint
+        url = self._urls.get(key)
+        if url is None:
+            url = self._urls[key] = "http://{0}:{1}/{2}".format(*key).encode("ascii")
+        return url
 
 
 if __name__ == "__main__":
-    ntrip_streamer()  # type: ignore
+    from .cli import ntrip_streamer
+
+    ntrip_streamer()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional
 
 import click
 import sys
@@ -10,6 +10,76 @@ import sys
 from base64 import b64decode
 
 
+_COALESCING_WINDOW = 0.02
+"""Chunks of a recording that are closer to each other in time than this
+value (in seconds) are sent together in a single write.
+"""
+
+_MAX_COALESCED_CHUNK_SIZE = 16384
+"""Maximum size of a single write when coalescing chunks of a recording."""
+
+
+class _RecordCoalescer:
+    """Merges the chunks of a recording that follow each other within a short
+    time window so they can be sent with fewer writes.
+
+    Records are pushed one by one as pairs of delays (in seconds, relative to
+    the previous chunk) and chunks. The delays that were absorbed into a
+    merged chunk are added to the delay of the next chunk so the total
+    duration of the recording stays the same, and no chunk is sent earlier
+    than scheduled by more than the coalescing window.
+    """
+
+    _delay: float
+    _group: list[bytes]
+    _group_size: int
+    _absorbed: float
+
+    def __init__(self):
+        self._delay = 0.0
+        self._group = []
+        self._group_size = 0
+        self._absorbed = 0.0
+
+    def push(self, delay: float, chunk: bytes) -> Optional[tuple[float, bytes]]:
+        """Adds the next record of the recording.
+
+        Returns:
+            the previous, merged record if the new chunk could not be merged
+            into it, ``None`` otherwise
+        """
+        group = self._group
+        if (
+            group
+            and self._absorbed + delay < _COALESCING_WINDOW
+            and self._group_size + len(chunk) <= _MAX_COALESCED_CHUNK_SIZE
+        ):
+            group.append(chunk)
+            self._group_size += len(chunk)
+            self._absorbed += delay
+            return None
+
+        result = (self._delay, b"".join(group)) if group else None
+        self._delay = delay + self._absorbed
+        self._group = [chunk]
+        self._group_size = len(chunk)
+        self._absorbed = 0.0
+        return result
+
+    def flush(self) -> Optional[tuple[float, bytes]]:
+        """Returns the last, merged record that has not been returned yet,
+        or ``None`` if there is no such record.
+        """
+        if not self._group:
+            return None
+
+        result = self._delay, b"".join(self._group)
+        self._group = []
+        self._group_size = 0
+        self._absorbed = 0.0
+        return result
+
+
 @click.command()
 @click.argument("file")
 @click.option(
@@ -24,9 +94,44 @@ from base64 import b64decode
     default=False,
     help="dump the recorded NTRIP stream to the standard output",
 )
-def ntrip_replayer(file, port: int = 5555, stdout: bool = False):
+@click.option(
+    "--preload/--no-preload",
+    default=True,
+    help=(
+        "load and decode the entire recording into memory at startup (the "
+        "default) instead of re-reading the file in every loop. Use "
+        "--no-preload for recordings that are too large to keep in memory"
+    ),
+)
+@click.option(
+    "--coalesce/--no-coalesce",
+    default=False,
+    help=(
+        "merge chunks that follow each other within 20 milliseconds into a "
+        "single write, up to 16 KiB per write. Merged chunks may be sent up "
+        "to 20 milliseconds earlier than recorded. The default is to replay "
+        "the chunks exactly as they were recorded"
+    ),
+)
+def ntrip_replayer(
+    file,
+    port: int = 5555,
+    stdout: bool = False,
+    preload: bool = True,
+    coalesce: bool = False,
+):
     """Replays a recorded NTRIP stream from JSON format to clients connecting
     to the given TCP port, looped infinitely.
+
+    By default, the entire recording is decoded into memory at startup; use
+    --no-preload to stream it from the file in every loop instead. The replay
+    stops if the recording contains no chunks at all.
+
+    Each chunk is sent in a separate write, at the time it was recorded. With
+    --coalesce, chunks that follow each other within 20 milliseconds are
+    merged into a single write of at most 16 KiB instead, which reduces the
+    number of writes for recordings with many small chunks at the expense of
+    sending some chunks slightly earlier and with different boundaries.
     """
     from json import loads
 
@@ -40,14 +145,50 @@ def ntrip_replayer(file, port: int = 5555, stdout: bool = False):
     def log(msg: str) -> None:
         print(msg, file=sys.stderr)
 
-    async def iter_contents_of(file: str) -> AsyncIterator[bytes]:
-        while True:
+    def load_contents_of(file: str) -> list[tuple[float, bytes]]:
+        with open(file) as fp:
+            return [
+                (obj["dt"] / 1000, b64decode(obj["data"])) for obj in map(loads, fp)
+            ]
+
+    async def iter_records_of(file: str) -> AsyncIterator[tuple[float, bytes]]:
+        if records is not None:
+            # An empty recording has nothing to loop over
+            while records:
+                for record in records:
+                    yield record
+            return
+
+        empty = False
+        while not empty:
+            empty = True
             fp = await Path(file).open("r")  # type: ignore
             async with fp:
                 async for line in fp:
                     obj = loads(line)
-                    await sleep(obj["dt"] / 1000)
-                    yield b64decode(obj["data"])
+                    empty = False
+                    yield obj["dt"] / 1000, b64decode(obj["data"])
+
+    async def iter_contents_of(file: str) -> AsyncIterator[bytes]:
+        if not coalesce:
+            async for delay, chunk in iter_records_of(file):
+                await sleep(delay)
+                yield chunk
+            return
+
+        # Closely spaced chunks are merged here so the recording is sent with
+        # the same writes no matter where the records come from
+        coalescer = _RecordCoalescer()
+        async for delay, chunk in iter_records_of(file):
+            record = coalescer.push(delay, chunk)
+            if record is not None:
+                await sleep(record[0])
+                yield record[1]
+
+        record = coalescer.flush()
+        if record is not None:
+            await sleep(record[0])
+            yield record[1]
 
     async def handle_request(stream):
         log("Connection open")
@@ -69,6 +210,10 @@ def ntrip_replayer(file, port: int = 5555, stdout: bool = False):
             sys.stdout.buffer.write(chunk)
             sys.stdout.buffer.flush()
 
+    # The decoded records are immutable so they are shared by all the
+    # connections
+    records = load_contents_of(file) if preload else None
+
     async def main():
         async with open_nursery() as nursery:
             if port > 0:
@@ -37,6 +37,11 @@ def _create_gps_subparser(format: str) -> Parser[Any]:
 
 _NOTHING = ()
 
+_SINGLE_BYTES = [bytes((i,)) for i in range(256)]
+"""Single-byte bytes objects for all possible byte values, indexed by the
+value of the byte.
+"""
+
 
 def _null_parser(data: bytes) -> Iterable[Any]:
     return _NOTHING
@@ -66,25 +71,28 @@ def create_gps_parser(
     if len(parsers) == 1:
         return parsers[0].feed
 
+    feeds = [parser.feed for parser in parsers]
+
     def combined_parser(data: bytes) -> Any:
         # We have to feed the bytes one by one to the subparsers so we can reset
         # all parsers as soon as one of them indicates that it has parsed a
         # message
-        chars = [b"%c" % ch for ch in data]
+        single_bytes = _SINGLE_BYTES
         result = []
-        successful_parsers = []
-        for ch in chars:
-            for parser in parsers:
-                messages = parser.feed(ch)
-                result.extend(messages)
+        successful_feeds = []
+        for byte in data:
+            ch = single_bytes[byte]
+            for feed in feeds:
+                messages = feed(ch)
                 if messages:
-                    successful_parsers.append(parser)
+                    result.extend(messages)
+                    successful_feeds.append(feed)
 
-            if successful_parsers:
-                for parser in parsers:
-                    if parser not in successful_parsers:
+            if successful_feeds:
+                for parser, feed in zip(parsers, feeds):
+                    if feed not in successful_feeds:
                         parser.reset()
-                successful_parsers.clear()
+                successful_feeds.clear()
 
         return result
 
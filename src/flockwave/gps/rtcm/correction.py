@@ -1,36 +1,62 @@
 """Satellite position correction data related classes."""
 
-from typing import NamedTuple, Optional
+from dataclasses import dataclass
 
 
-class CorrectionData(
-    NamedTuple(
-        "CorrectionData",
-        [("svid", int), ("prc", float), ("prrc", float), ("iode", float)],
-    )
-):
+@dataclass(frozen=True)
+class CorrectionData:
     """Satellite position correction data in an RTCM v2 packet."""
 
-    _scale_factor: Optional[float]
-    _scaled_prc: Optional[float]
-    _scaled_prrc: Optional[float]
+    # The scaled values are calculated at construction time and stored in the
+    # slots that start with an underscore. These slots are deliberately not
+    # dataclass fields so they are excluded from the constructor, repr() and
+    # comparisons
+    __slots__ = (
+        "svid",
+        "prc",
+        "prrc",
+        "iode",
+        "_scale_factor",
+        "_scaled_prc",
+        "_scaled_prrc",
+    )
+
+    svid: int
+    prc: float
+    prrc: float
+    iode: float
+
+    def __post_init__(self) -> None:
+        scaled_prc = self.prc
+        scaled_prrc = self.prrc
+        factor = 0
+        while scaled_prc > 32767 or scaled_prc < -32768:
+            factor += 1
+            scaled_prc = (scaled_prc + 8) // 16
+            scaled_prrc = (scaled_prrc + 8) // 16
+        scaled_prrc = min(127, max(scaled_prrc, -128))
 
-    def __init__(self, *args, **kwds):
-        """Constructor."""
-        super().__init__(*args, **kwds)
-        self._scale_factor = None
-        self._scaled_prc = None
-        self._scaled_prrc = None
+        # The dataclass is frozen so the slots must be filled via object
+        object.__setattr__(self, "_scale_factor", factor)
+        object.__setattr__(self, "_scaled_prc", scaled_prc)
+        object.__setattr__(self, "_scaled_prrc", scaled_prrc)
+
+    def __getstate__(self) -> tuple[int, float, float, float]:
+        return self.svid, self.prc, self.prrc, self.iode
+
+    def __setstate__(self, state: tuple[int, float, float, float]) -> None:
+        # The default implementation would go through the __setattr__() of
+        # the frozen dataclass, which refuses to assign anything
+        for name, value in zip(("svid", "prc", "prrc", "iode"), state):
+            object.__setattr__(self, name, value)
+        self.__post_init__()
 
     @property
-    def scale_factor(self) -> float:
+    def scale_factor(self) -> int:
         """Returns the scale factor to use when storing the real ``prc``
         and ``prrc`` values in the bit-level representation of the
         correction data in an RTCM v2 packet.
         """
-        if self._scale_factor is None:
-            self._calculate_scale_factor()
-            assert self._scale_factor is not None
         return self._scale_factor
 
     @property
@@ -38,9 +64,6 @@ class CorrectionData(
         """Returns the scaled ``prc`` value to use when calculating the
         bit-level representation of the RTCM v2 packet.
         """
-        if self._scaled_prc is None:
-            self._calculate_scale_factor()
-            assert self._scaled_prc is not None
         return self._scaled_prc
 
     @property
@@ -48,22 +71,4 @@ class CorrectionData(
         """Returns the scaled ``prrc`` value to use when calculating the
         bit-level representation of the RTCM v2 packet.
         """
-        if self._scaled_prrc is None:
-            self._calculate_scale_factor()
-            assert self._scaled_prrc is not None
         return self._scaled_prrc
-
-    def _calculate_scale_factor(self) -> None:
-        scaled_prc = self.prc
-        scaled_prrc = self.prrc
-        factor = 0
-        while scaled_prc > 32767 or scaled_prc < -32768:
-            factor += 1
-            scaled_prc = (scaled_prc + 8) // 16
-            scaled_prrc = (scaled_prrc + 8) // 16
-        scaled_prrc = min(127, max(scaled_prrc, -128))
-        self._scale_factor, self._scaled_prc, self._scaled_prrc = (
-            factor,
-            scaled_prc,
-            scaled_prrc,
-        )
@@ -2,7 +2,6 @@
 
 import logging
 
-from builtins import range
 from collections import namedtuple
 from math import atan, cos, sin, sqrt
 
@@ -32,7 +31,8 @@ class EphemerisData(_EphemerisData):
 
     @property
     def a(self):
-        return self.sqrt_a**2
+        sqrt_a = self.sqrt_a
+        return sqrt_a * sqrt_a
 
     def calculate_satellite_position(
         self, transmit_time: float = 0, time_of_flight: float = 0
@@ -61,7 +61,9 @@ class EphemerisData(_EphemerisData):
         elif T < -half_week:
             T = T + 2 * half_week
 
-        n = sqrt(mu / (self.sqrt_a**6)) + self.delta_n
+        sqrt_a = self.sqrt_a
+        a = sqrt_a * sqrt_a
+        n = sqrt(mu / (a * a * a)) + self.delta_n
         ecc = self.eccentricity
 
         # Kepler equation
@@ -80,7 +82,7 @@ class EphemerisData(_EphemerisData):
             )
 
         sin_e, cos_e = sin(E), cos(E)
-        snu = sqrt(1 - ecc**2) * sin_e / (1 - ecc * cos_e)
+        snu = sqrt(1 - ecc * ecc) * sin_e / (1 - ecc * cos_e)
         cnu = (cos_e - ecc) / (1 - ecc * cos_e)
 
         # The paragraph below is basically equivalent to
@@ -107,7 +109,7 @@ class EphemerisData(_EphemerisData):
         di = self.cic * cos_2_phi + self.cis * sin_2_phi
 
         u = phi + du
-        r = self.a * (1 - ecc * cos_e) + dr
+        r = a * (1 - ecc * cos_e) + dr
         i = self.i0 + self.i_dot * T + di
 
         x_dash = r * cos(u)
@@ -123,7 +125,7 @@ class EphemerisData(_EphemerisData):
             y=x_dash * sin_wc + y_dash * cos_i * cos_wc,
             z=y_dash * sin(i),
         )
-        rel_term = -4.442807633e-10 * ecc * self.sqrt_a * sin_e
+        rel_term = -4.442807633e-10 * ecc * sqrt_a * sin_e
 
         if time_of_flight != 0:
             omega_e_dot = 7.292115e-5
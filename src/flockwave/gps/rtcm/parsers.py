@@ -1,7 +1,6 @@
 """Parser that parses streamed RTCM V3 messages."""
 
 from abc import ABCMeta, abstractmethod
-from builtins import bytes, range
 from bitstring import ConstBitStream
 from enum import Enum
 from typing import (
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
-from math import atan2, cos, degrees, radians, sin, sqrt
-from typing import Any, Optional, TypeVar
-
+from math import cos, hypot, pi, radians, sin, sqrt
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence, TypeVar
+
+from ._kernels import (
+    ecef_from_geodetic,
+    geodetic_from_ecef,
+    geodetic_from_ecef_array,
+    olson_parameters,
+)
 from .constants import WGS84
 
+if TYPE_CHECKING:
+    from .arrays import ECEFCoordinateArray, GPSCoordinateArray
 
 __all__ = (
     "GPSCoordinate",
@@ -23,6 +31,41 @@ C = TypeVar("C", bound="Vector3D")
 C2 = TypeVar("C2", bound="GPSCoordinate")
 C3 = TypeVar("C3", bound="FlatEarthCoordinate")
 
+_DEGREES_PER_RADIAN = 180.0 / pi
+"""Multiplier that converts radians to degrees."""
+
+_WGS84_EQUATORIAL_RADIUS = WGS84.EQUATORIAL_RADIUS_IN_METERS
+"""Equatorial radius of the WGS84 ellipsoid, in metres."""
+
+_WGS84_ECCENTRICITY_SQUARED = WGS84.ECCENTRICITY_SQUARED
+"""Square of the eccentricity of the WGS84 ellipsoid."""
+
+_WGS84_MERIDIAN_RADIUS_AT_EQUATOR = _WGS84_EQUATORIAL_RADIUS * (
+    1 - _WGS84_ECCENTRICITY_SQUARED
+)
+"""Meridional radius of curvature of the WGS84 ellipsoid at the equator,
+in metres.
+"""
+
+
+def _altitudes_from_json(
+    data: Sequence[Optional[int]],
+) -> tuple[Optional[float], Optional[float], Optional[float]]:
+    """Extracts the AMSL, AHL and AGL altitudes from the JSON representation
+    of a coordinate, converting them from millimetres to metres.
+
+    Each altitude is looked up only once; trailing ones may be omitted.
+    """
+    length = len(data)
+    amsl = data[2] if length > 2 else None
+    ahl = data[3] if length > 3 else None
+    agl = data[4] if length > 4 else None
+    return (
+        amsl * 1e-3 if amsl is not None else None,
+        ahl * 1e-3 if ahl is not None else None,
+        agl * 1e-3 if agl is not None else None,
+    )
+
 
 class AltitudeMixin:
     """Mixin class for objects that have an altitude component. Provides
@@ -31,6 +74,8 @@ class AltitudeMixin:
     appropriate getters and setters.
     """
 
+    __slots__ = ("_agl", "_ahl", "_amsl")
+
     _agl: Optional[float]
     _ahl: Optional[float]
     _amsl: Optional[float]
@@ -42,12 +87,9 @@ class AltitudeMixin:
         agl: Optional[float] = None,
     ):
         """Constructor."""
-        self._agl = None
-        self._ahl = None
-        self._amsl = None
-        self.agl = agl
-        self.ahl = ahl
-        self.amsl = amsl
+        self._agl = float(agl) if agl is not None else None
+        self._ahl = float(ahl) if ahl is not None else None
+        self._amsl = float(amsl) if amsl is not None else None
 
     @property
     def agl(self) -> Optional[float]:
@@ -80,6 +122,8 @@ class AltitudeMixin:
 class Vector3D:
     """Generic 3D vector."""
 
+    __slots__ = ("_x", "_y", "_z")
+
     _x: float
     _y: float
     _z: float
@@ -89,6 +133,15 @@ class Vector3D:
         """Creates a generic 3D vector from its JSON representation."""
         return cls(x=float(data[0]), y=float(data[1]), z=float(data[2]))
 
+    @classmethod
+    def _from_floats(cls: type[C], x: float, y: float, z: float) -> C:
+        """Creates a vector from coordinates that are known to be floats
+        already, bypassing the constructor and the property setters.
+        """
+        result = cls.__new__(cls)
+        result._x, result._y, result._z = x, y, z
+        return result
+
     def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
         """Constructor.
 
@@ -97,28 +150,30 @@ class Vector3D:
             y: the Y coordinate
             z: the Z coordinate
         """
-        self._x, self._y, self._z = 0.0, 0.0, 0.0
-        self.x = x
-        self.y = y
-        self.z = z
+        self._x, self._y, self._z = float(x), float(y), float(z)
 
     def copy(self: C) -> C:
         """Creates a copy of this vector."""
-        # Don't use keyword arguments below; it would break VelocityNED
-        return self.__class__(self.x, self.y, self.z)
+        return self._from_floats(self._x, self._y, self._z)
 
     def distance(self, other: Vector3D) -> float:
         """Returns the distance between this position and another 3D
         vector.
         """
-        if isinstance(other, Vector3D):
-            return (
-                (self._x - other._x) ** 2
-                + (self._y - other._y) ** 2
-                + (self._z - other._z) ** 2
-            ) ** 0.5
-        else:
-            raise TypeError("expected Vector3D, got {0!r}".format(type(other)))
+        # hypot() avoids overflow and underflow in the intermediate squares
+        return hypot(self._x - other._x, self._y - other._y, self._z - other._z)
+
+    def distance_sq(self, other: Vector3D) -> float:
+        """Returns the squared distance between this position and another 3D
+        vector.
+
+        This is cheaper than `distance()` and it is sufficient when distances
+        only need to be compared to each other.
+        """
+        dx = self._x - other._x
+        dy = self._y - other._y
+        dz = self._z - other._z
+        return dx * dx + dy * dy + dz * dz
 
     def round(self, precision: int) -> None:
         """Rounds the coordinates of the vector to the given number of
@@ -210,8 +265,7 @@ class Vector3D:
             return False
 
     def __floordiv__(self: C, other: float) -> C:
-        # Don't use keyword arguments below; it would break VelocityNED
-        return self.__class__(self._x // other, self._y // other, self._z // other)
+        return self._from_floats(self._x // other, self._y // other, self._z // other)
 
     def __hash__(self):
         return hash((self._x, self._y, self._z))
@@ -232,12 +286,10 @@ class Vector3D:
         self._z /= other
 
     def __truediv__(self: C, other: float) -> C:
-        # Don't use keyword arguments below; it would break VelocityNED
-        return self.__class__(self.x / other, self.y / other, self.z / other)
+        return self._from_floats(self._x / other, self._y / other, self._z / other)
 
     def __mul__(self: C, other: float) -> C:
-        # Don't use keyword arguments below; it would break VelocityNED
-        return self.__class__(self.x * other, self.y * other, self.z * other)
+        return self._from_floats(self._x * other, self._y * other, self._z * other)
 
     def __repr__(self) -> str:
         return "{0.__class__.__name__}(x={0.x!r}, y={0.y!r}, z={0.z!r})".format(self)
@@ -251,6 +303,8 @@ class PositionXYZ(Vector3D):
     as integers in mm instead of the raw floating-point values.
     """
 
+    __slots__ = ()
+
     @classmethod
     def from_json(cls, data: list[float]):
         """Creates an XYZ position vector from its JSON representation."""
@@ -260,9 +314,9 @@ class PositionXYZ(Vector3D):
     def json(self) -> list[int]:
         """Returns the JSON representation of the coordinate."""
         return [
-            int(round(self._x * 1e3)),
-            int(round(self._y * 1e3)),
-            int(round(self._z * 1e3)),
+            round(self._x * 1e3),
+            round(self._y * 1e3),
+            round(self._z * 1e3),
         ]
 
 
@@ -274,6 +328,8 @@ class VelocityXYZ(Vector3D):
     as integers in mm/s instead of the raw floating-point values.
     """
 
+    __slots__ = ()
+
     @classmethod
     def from_json(cls, data: list[float]):
         """Creates an XYZ position vector from its JSON representation."""
@@ -283,9 +339,9 @@ class VelocityXYZ(Vector3D):
     def json(self) -> list[int]:
         """Returns the JSON representation of the coordinate."""
         return [
-            int(round(self._x * 1e3)),
-            int(round(self._y * 1e3)),
-            int(round(self._z * 1e3)),
+            round(self._x * 1e3),
+            round(self._y * 1e3),
+            round(self._z * 1e3),
         ]
 
 
@@ -299,6 +355,8 @@ class VelocityNED(Vector3D):
     mm/s instead of the raw floating-point values.
     """
 
+    __slots__ = ()
+
     @classmethod
     def from_json(cls, data: list[float]):
         """Creates a NED velocity vector from its JSON representation."""
@@ -341,9 +399,9 @@ class VelocityNED(Vector3D):
     def json(self) -> list[int]:
         """Returns the JSON representation of the coordinate."""
         return [
-            int(round(self._x * 1e3)),
-            int(round(self._y * 1e3)),
-            int(round(self._z * 1e3)),
+            round(self._x * 1e3),
+            round(self._y * 1e3),
+            round(self._z * 1e3),
         ]
 
     @property
@@ -390,6 +448,8 @@ class ECEFCoordinate(Vector3D):
 
     """
 
+    __slots__ = ()
+
     @classmethod
     def from_json(cls, data):
         """Creates an ECEF coordinate from its JSON representation."""
@@ -399,9 +459,9 @@ class ECEFCoordinate(Vector3D):
     def json(self) -> list[int]:
         """Returns the JSON representation of the coordinate."""
         return [
-            int(round(self._x * 1e3)),
-            int(round(self._y * 1e3)),
-            int(round(self._z * 1e3)),
+            round(self._x * 1e3),
+            round(self._y * 1e3),
+            round(self._z * 1e3),
         ]
 
 
@@ -410,21 +470,37 @@ class GPSCoordinate(AltitudeMixin):
     and relative or MSL altitude.
     """
 
+    __slots__ = ("_lat", "_lon")
+
     _lat: float
     _lon: float
 
     @classmethod
     def from_json(cls, data):
         """Creates a GPS coordinate from its JSON representation."""
-        length = len(data)
-        return cls(
-            lat=data[0] * 1e-7,
-            lon=data[1] * 1e-7,
-            amsl=data[2] * 1e-3 if length > 2 and data[2] is not None else None,
-            ahl=data[3] * 1e-3 if length > 3 and data[3] is not None else None,
-            agl=data[4] * 1e-3 if length > 4 and data[4] is not None else None,
+        # Multiplying by the scale factors yields floats so there is no need
+        # to go through the constructor
+        return cls._from_floats(
+            data[0] * 1e-7, data[1] * 1e-7, *_altitudes_from_json(data)
         )
 
+    @classmethod
+    def _from_floats(
+        cls: type[C2],
+        lat: float,
+        lon: float,
+        amsl: Optional[float] = None,
+        ahl: Optional[float] = None,
+        agl: Optional[float] = None,
+    ) -> C2:
+        """Creates a GPS coordinate from values that are known to be floats
+        (or ``None`` for the altitudes) already, bypassing the constructor.
+        """
+        result = cls.__new__(cls)
+        result._lat, result._lon = lat, lon
+        result._amsl, result._ahl, result._agl = amsl, ahl, agl
+        return result
+
     def __init__(
         self,
         lat: float = 0.0,
@@ -442,16 +518,15 @@ class GPSCoordinate(AltitudeMixin):
             ahl: the altitude above home level, if known
             agl: the altitude above ground level, if known
         """
-        AltitudeMixin.__init__(self, amsl=amsl, ahl=ahl, agl=agl)
-        self._lat, self._lon = 0.0, 0.0
-        self.lat = float(lat)
-        self.lon = float(lon)
+        # Bypass the property setters; the conversions below do the same
+        self._lat, self._lon = float(lat), float(lon)
+        self._amsl = float(amsl) if amsl is not None else None
+        self._ahl = float(ahl) if ahl is not None else None
+        self._agl = float(agl) if agl is not None else None
 
     def copy(self: C2) -> C2:
         """Returns a copy of the current GPS coordinate object."""
-        return self.__class__(
-            lat=self.lat, lon=self.lon, amsl=self.amsl, ahl=self.ahl, agl=self.agl
-        )
+        return self._from_floats(self._lat, self._lon, self._amsl, self._ahl, self._agl)
 
     def format(self) -> str:
         """Formats the GPS coordinate as a string."""
@@ -465,18 +540,18 @@ class GPSCoordinate(AltitudeMixin):
     @property
     def json(self) -> list[int]:
         """Returns the JSON representation of the coordinate."""
-        retval = [
-            int(round(self._lat * 1e7)),
-            int(round(self._lon * 1e7)),
-            int(round(self._amsl * 1e3)) if self._amsl is not None else None,
-            int(round(self._ahl * 1e3)) if self._ahl is not None else None,
-        ]
+        amsl, ahl, agl = self._amsl, self._ahl, self._agl
+        lat = round(self._lat * 1e7)
+        lon = round(self._lon * 1e7)
+        amsl_mm = round(amsl * 1e3) if amsl is not None else None
+        ahl_mm = round(ahl * 1e3) if ahl is not None else None
+
         # for back-compatibility reasons we allow a list of only 4 elements,
         # and use 5-element list only when AGL altitude is explicitly given
-        if self._agl is not None:
-            retval.append(int(round(self._agl * 1e3)))
-
-        return retval
+        if agl is None:
+            return [lat, lon, amsl_mm, ahl_mm]
+        else:
+            return [lat, lon, amsl_mm, ahl_mm, round(agl * 1e3)]
 
     @property
     def lat(self) -> float:
@@ -530,15 +605,15 @@ class GPSCoordinate(AltitudeMixin):
                 longitude to; ``None`` means to take the values as they are
         """
         if lat is not None:
-            self.lat = lat
+            self._lat = float(lat)
         if lon is not None:
-            self.lon = lon
+            self._lon = float(lon)
         if amsl is not None:
-            self.amsl = amsl
+            self._amsl = float(amsl)
         if ahl is not None:
-            self.ahl = ahl
+            self._ahl = float(ahl)
         if agl is not None:
-            self.agl = agl
+            self._agl = float(agl)
         if precision is not None:
             self.round(precision)
 
@@ -554,11 +629,11 @@ class GPSCoordinate(AltitudeMixin):
                 longitude to; ``None`` means to take the values as they are
         """
         self.update(
-            lat=other.lat,
-            lon=other.lon,
-            amsl=other.amsl,
-            ahl=other.ahl,
-            agl=other.agl,
+            lat=other._lat,
+            lon=other._lon,
+            amsl=other._amsl,
+            ahl=other._ahl,
+            agl=other._agl,
             precision=precision,
         )
 
@@ -566,21 +641,38 @@ class GPSCoordinate(AltitudeMixin):
 class FlatEarthCoordinate(AltitudeMixin):
     """Class representing a coordinate given in flat Earth coordinates."""
 
+    __slots__ = ("_x", "_y")
+
     _x: float
     _y: float
 
     @classmethod
     def from_json(cls, data):
         """Creates a flat Earth coordinate from its JSON representation."""
-        length = len(data)
-        return cls(
-            x=data[0] * 1e-3,
-            y=data[1] * 1e-3,
-            amsl=data[2] * 1e-3 if length > 2 and data[2] is not None else None,
-            ahl=data[3] * 1e-3 if length > 3 and data[3] is not None else None,
-            agl=data[4] * 1e-3 if length > 4 and data[4] is not None else None,
+        # Multiplying by the scale factors yields floats so there is no need
+        # to go through the constructor
+        return cls._from_floats(
+            data[0] * 1e-3, data[1] * 1e-3, *_altitudes_from_json(data)
         )
 
+    @classmethod
+    def _from_floats(
+        cls: type[C3],
+        x: float,
+        y: float,
+        amsl: Optional[float] = None,
+        ahl: Optional[float] = None,
+        agl: Optional[float] = None,
+    ) -> C3:
+        """Creates a flat Earth coordinate from values that are known to be
+        floats (or ``None`` for the altitudes) already, bypassing the
+        constructor.
+        """
+        result = cls.__new__(cls)
+        result._x, result._y = x, y
+        result._amsl, result._ahl, result._agl = amsl, ahl, agl
+        return result
+
     def __init__(
         self,
         x: float = 0.0,
@@ -598,32 +690,30 @@ class FlatEarthCoordinate(AltitudeMixin):
             ahl: the altitude above home level, if known
             agl: the altitude above ground level, if known
         """
-        AltitudeMixin.__init__(self, amsl=amsl, ahl=ahl, agl=agl)
-        self._x, self._y = 0.0, 0.0
-        self.x = x
-        self.y = y
+        self._x, self._y = float(x), float(y)
+        self._amsl = float(amsl) if amsl is not None else None
+        self._ahl = float(ahl) if ahl is not None else None
+        self._agl = float(agl) if agl is not None else None
 
     def copy(self: C3) -> C3:
         """Returns a copy of the current flat Earth coordinate object."""
-        return self.__class__(
-            x=self.x, y=self.y, amsl=self.amsl, ahl=self.ahl, agl=self.agl
-        )
+        return self._from_floats(self._x, self._y, self._amsl, self._ahl, self._agl)
 
     @property
     def json(self) -> list[int]:
         """Returns the JSON representation of the coordinate."""
-        retval = [
-            int(round(self._x * 1e3)),
-            int(round(self._y * 1e3)),
-            int(round(self._amsl * 1e3)) if self._amsl is not None else None,
-            int(round(self._ahl * 1e3)) if self._ahl is not None else None,
-        ]
+        amsl, ahl, agl = self._amsl, self._ahl, self._agl
+        x = round(self._x * 1e3)
+        y = round(self._y * 1e3)
+        amsl_mm = round(amsl * 1e3) if amsl is not None else None
+        ahl_mm = round(ahl * 1e3) if ahl is not None else None
+
         # for back-compatibility reasons we allow a list of only 4 elements,
         # and use 5-element list only when AGL altitude is explicitly given
-        if self._agl is not None:
-            retval.append(int(round(self._agl * 1e3)))
-
-        return retval
+        if agl is None:
+            return [x, y, amsl_mm, ahl_mm]
+        else:
+            return [x, y, amsl_mm, ahl_mm, round(agl * 1e3)]
 
     def round(self, precision: int) -> None:
         """Rounds the X and Y coordinates of the vector to the given
@@ -659,15 +749,15 @@ class FlatEarthCoordinate(AltitudeMixin):
                 coordinates to; ``None`` means to take the values as they are
         """
         if x is not None:
-            self.x = x
+            self._x = float(x)
         if y is not None:
-            self.y = y
+            self._y = float(y)
         if amsl is not None:
-            self.amsl = amsl
+            self._amsl = float(amsl)
         if ahl is not None:
-            self.ahl = ahl
+            self._ahl = float(ahl)
         if agl is not None:
-            self.agl = agl
+            self._agl = float(agl)
         if precision is not None:
             self.round(precision)
 
@@ -681,11 +771,11 @@ class FlatEarthCoordinate(AltitudeMixin):
                 coordinates to; ``None`` means to take the values as they are
         """
         self.update(
-            x=other.x,
-            y=other.y,
-            amsl=other.amsl,
-            ahl=other.ahl,
-            agl=other.agl,
+            x=other._x,
+            y=other._y,
+            amsl=other._amsl,
+            ahl=other._ahl,
+            agl=other._agl,
             precision=precision,
         )
 
@@ -713,8 +803,16 @@ class ECEFToGPSCoordinateTransformation:
     and vice versa.
     """
 
-    _eq_radius: float
-    _polar_radius: float
+    # The parameters of the WGS84 ellipsoid are calculated once at class level
+    # and shared by all the instances that use the default ellipsoid
+    _eq_radius: float = _WGS84_EQUATORIAL_RADIUS
+    _polar_radius: float = WGS84.POLAR_RADIUS_IN_METERS
+    _ecc_sq: float = (
+        (_eq_radius - _polar_radius)
+        * (_eq_radius + _polar_radius)
+        / (_eq_radius * _eq_radius)
+    )
+    _olson_params: tuple[float, ...] = olson_parameters(_eq_radius, _ecc_sq)
 
     def __init__(self, radii: Optional[tuple[float, float]] = None):
         """Constructor.
@@ -723,10 +821,7 @@ class ECEFToGPSCoordinateTransformation:
             radii: the equatorial and the polar radius, in metres. ``None``
                 means to use the WGS84 ellipsoid.
         """
-        self._eq_radius, self._polar_radius = 0.0, 0.0
-        if radii is None:
-            self.radii = WGS84.EQUATORIAL_RADIUS_IN_METERS, WGS84.POLAR_RADIUS_IN_METERS
-        else:
+        if radii is not None:
             self.radii = radii
 
     @property
@@ -744,15 +839,11 @@ class ECEFToGPSCoordinateTransformation:
         """Recalculates some cached values that are re-used across different
         transformations.
         """
-        self._eq_radius_sq = self._eq_radius**2
-        self._polar_radius_sq = self._polar_radius**2
-        self._ecc_sq = 1 - self._polar_radius_sq / self._eq_radius_sq
-        self._ep_sq_times_polar_radius = (
-            self._eq_radius_sq - self._polar_radius_sq
-        ) / self._polar_radius
-        self._ecc_sq_times_eq_radius = (
-            self._eq_radius - self._polar_radius_sq / self._eq_radius
-        )
+        a, b = self._eq_radius, self._polar_radius
+        # (a - b) * (a + b) does not suffer from the cancellation of 1 - b²/a²
+        # when the ellipsoid is nearly spherical
+        self._ecc_sq = (a - b) * (a + b) / (a * a)
+        self._olson_params = olson_parameters(a, self._ecc_sq)
 
     def to_ecef(self, coord: GPSCoordinate) -> ECEFCoordinate:
         """Converts the given GPS coordinates to ECEF coordinates.
@@ -763,20 +854,83 @@ class ECEFToGPSCoordinateTransformation:
         Returns:
             the converted coordinate
         """
-        if coord.amsl is None:
+        amsl = coord._amsl
+        if amsl is None:
             raise ValueError(
-                "GPS coordinates need an altitude relative " "to the mean sea level"
+                "GPS coordinates need an altitude relative to the mean sea level"
             )
 
-        lat, lon = radians(coord.lat), radians(coord.lon)
-        height = coord.amsl
+        x, y, z = ecef_from_geodetic(
+            radians(coord._lat),
+            radians(coord._lon),
+            amsl,
+            self._eq_radius,
+            self._ecc_sq,
+        )
+        return ECEFCoordinate._from_floats(x, y, z)
+
+    def to_ecef_many(self, coords: Iterable[GPSCoordinate]) -> list[ECEFCoordinate]:
+        """Converts multiple GPS coordinates to ECEF coordinates.
+
+        This is equivalent to calling `to_ecef()` for each coordinate, but the
+        parameters of the ellipsoid are looked up only once for the entire
+        batch.
+
+        Parameters:
+            coords: the coordinates to convert
+
+        Returns:
+            the converted coordinates, in the same order as the input
+        """
+        a, e2 = self._eq_radius, self._ecc_sq
+        from_floats = ECEFCoordinate._from_floats
+        result: list[ECEFCoordinate] = []
+        append = result.append
+
+        for coord in coords:
+            amsl = coord._amsl
+            if amsl is None:
+                raise ValueError(
+                    "GPS coordinates need an altitude relative to the mean sea level"
+                )
+            x, y, z = ecef_from_geodetic(
+                radians(coord._lat), radians(coord._lon), amsl, a, e2
+            )
+            append(from_floats(x, y, z))
 
-        n = self._eq_radius / sqrt(1 - self._ecc_sq * (sin(lat) ** 2))
-        cos_lat = cos(lat)
-        x = (n + height) * cos_lat * cos(lon)
-        y = (n + height) * cos_lat * sin(lon)
-        z = (n * (1 - self._ecc_sq) + height) * sin(lat)
-        return ECEFCoordinate(x=x, y=y, z=z)
+        return result
+
+    def to_ecef_array(self, coords: GPSCoordinateArray) -> ECEFCoordinateArray:
+        """Converts an array of GPS coordinates to ECEF coordinates in a single
+        vectorized pass. Requires NumPy.
+
+        Parameters:
+            coords: the coordinates to convert
+
+        Returns:
+            the converted coordinates
+        """
+        from .arrays import ECEFCoordinateArray, _numpy
+
+        np = _numpy()
+        if np.isnan(coords.amsl).any():
+            raise ValueError(
+                "GPS coordinates need an altitude relative to the mean sea level"
+            )
+
+        # The scalar kernel consists of arithmetic only, so it works on whole
+        # arrays if we substitute the NumPy equivalents of the math functions
+        x, y, z = ecef_from_geodetic(
+            np.radians(coords.lat),
+            np.radians(coords.lon),
+            coords.amsl,
+            self._eq_radius,
+            self._ecc_sq,
+            _sin=np.sin,
+            _cos=np.cos,
+            _sqrt=np.sqrt,
+        )
+        return ECEFCoordinateArray(np.column_stack((x, y, z)))
 
     def to_gps(self, coord: ECEFCoordinate) -> GPSCoordinate:
         """Converts the given ECEF coordinates to GPS coordinates.
@@ -787,18 +941,50 @@ class ECEFToGPSCoordinateTransformation:
         Returns:
             the converted coordinate
         """
-        x, y, z = coord.x, coord.y, coord.z
-        p = sqrt(x**2 + y**2)
-        th = atan2(self._eq_radius * z, self._polar_radius * p)
-        lon = atan2(y, x)
-        lat = atan2(
-            z + self._ep_sq_times_polar_radius * (sin(th) ** 3),
-            p - self._ecc_sq_times_eq_radius * (cos(th) ** 3),
+        # Same as to_gps_raw(), inlined to spare a method call per conversion
+        lat, lon, amsl = geodetic_from_ecef(
+            coord._x, coord._y, coord._z, *self._olson_params
+        )
+        return GPSCoordinate._from_floats(
+            lat * _DEGREES_PER_RADIAN, lon * _DEGREES_PER_RADIAN, amsl
+        )
+
+    def to_gps_array(self, coords: ECEFCoordinateArray) -> GPSCoordinateArray:
+        """Converts an array of ECEF coordinates to GPS coordinates in a single
+        vectorized pass. Requires NumPy.
+
+        Parameters:
+            coords: the coordinates to convert
+
+        Returns:
+            the converted coordinates
+        """
+        from .arrays import GPSCoordinateArray, _numpy
+
+        np = _numpy()
+        lat, lon, amsl = geodetic_from_ecef_array(
+            np, coords.x, coords.y, coords.z, *self._olson_params
         )
-        n = self._eq_radius / sqrt(1 - self._ecc_sq * (sin(lat) ** 2))
-        amsl = p / cos(lat) - n
-        lat, lon = degrees(lat), degrees(lon)
-        return GPSCoordinate(lat=lat, lon=lon, amsl=amsl)
+        return GPSCoordinateArray(np.degrees(lat), np.degrees(lon), amsl=amsl)
+
+    def to_gps_raw(self, x: float, y: float, z: float) -> tuple[float, float, float]:
+        """Converts the given ECEF coordinates to GPS coordinates without
+        wrapping the inputs or the result in coordinate objects.
+
+        This is useful for callers that convert many points and need the raw
+        values only.
+
+        Parameters:
+            x: the X coordinate, in metres
+            y: the Y coordinate, in metres
+            z: the Z coordinate, in metres
+
+        Returns:
+            the latitude and the longitude (in degrees) and the altitude above
+            mean sea level (in metres)
+        """
+        lat, lon, amsl = geodetic_from_ecef(x, y, z, *self._olson_params)
+        return lat * _DEGREES_PER_RADIAN, lon * _DEGREES_PER_RADIAN, amsl
 
 
 class FlatEarthToGPSCoordinateTransformation:
@@ -808,6 +994,13 @@ class FlatEarthToGPSCoordinateTransformation:
 
     _origin_lat: float
     _origin_lon: float
+    _orientation: float
+    _type: str
+
+    _r1: float
+    _r2_over_cos_origin_lat_in_radians: float
+    _metres_per_lat_degree: float
+    _metres_per_lon_degree: float
 
     _xmul: float
     _ymul: float
@@ -815,6 +1008,16 @@ class FlatEarthToGPSCoordinateTransformation:
     _sin_alpha: float
     _cos_alpha: float
 
+    _x_from_lat: float
+    _x_from_lon: float
+    _y_from_lat: float
+    _y_from_lon: float
+
+    _lat_from_x: float
+    _lat_from_y: float
+    _lon_from_x: float
+    _lon_from_y: float
+
     @staticmethod
     def _normalize_type(type: str) -> str:
         """Returns the normalized name of the given coordinate system type.
@@ -891,7 +1094,7 @@ class FlatEarthToGPSCoordinateTransformation:
     def orientation(self, value: float) -> None:
         if self._orientation != value:
             self._orientation = value
-            self._recalculate()
+            self._recalculate_orientation()
 
     @property
     def origin(self) -> GPSCoordinate:
@@ -916,30 +1119,70 @@ class FlatEarthToGPSCoordinateTransformation:
     def type(self, value: str) -> None:
         if self._type != value:
             self._type = value
-            self._recalculate()
+            self._recalculate_orientation()
 
     def _recalculate(self) -> None:
         """Recalculates some cached values that are re-used across different
         transformations.
         """
-        earth_radius = WGS84.EQUATORIAL_RADIUS_IN_METERS
-        eccentricity_sq = WGS84.ECCENTRICITY_SQUARED
+        self._recalculate_origin()
+        self._recalculate_orientation()
 
+    def _recalculate_origin(self) -> None:
+        """Recalculates the cached values that depend on the origin of the
+        coordinate system. Must be followed by a call to
+        `_recalculate_orientation()`.
+        """
         origin_lat_in_radians = radians(self._origin_lat)
-
-        x = 1 - eccentricity_sq * (sin(origin_lat_in_radians) ** 2)
-        self._r1 = earth_radius * (1 - eccentricity_sq) / (x**1.5)
+        sin_origin_lat = sin(origin_lat_in_radians)
+        cos_origin_lat = cos(origin_lat_in_radians)
+
+        # Meridional and normal radii of curvature at the origin; both are
+        # derived from the same square root, x**1.5 being x * sqrt(x)
+        x = 1 - _WGS84_ECCENTRICITY_SQUARED * sin_origin_lat * sin_origin_lat
+        inv_sqrt_x = 1.0 / sqrt(x)
+        self._r1 = _WGS84_MERIDIAN_RADIUS_AT_EQUATOR * inv_sqrt_x / x
         self._r2_over_cos_origin_lat_in_radians = (
-            earth_radius / sqrt(x) * cos(origin_lat_in_radians)
+            _WGS84_EQUATORIAL_RADIUS * inv_sqrt_x * cos_origin_lat
         )
 
-        self._sin_alpha = sin(radians(self._orientation))
-        self._cos_alpha = cos(radians(self._orientation))
+        # Length of one degree of latitude and longitude at the origin, in
+        # metres, so the conversions do not need to convert to radians
+        self._metres_per_lat_degree = self._r1 / _DEGREES_PER_RADIAN
+        self._metres_per_lon_degree = (
+            self._r2_over_cos_origin_lat_in_radians / _DEGREES_PER_RADIAN
+        )
+
+    def _recalculate_orientation(self) -> None:
+        """Recalculates the cached values that depend on the orientation and
+        the type of the coordinate system.
+        """
+        alpha = radians(self._orientation)
+        self._sin_alpha = sin(alpha)
+        self._cos_alpha = cos(alpha)
 
         self._xmul = 1
         self._ymul = 1 if self._type[1] == "e" else -1
         self._zmul = 1 if self._type[2] == "u" else -1
 
+        # The scaling between degrees and metres, the rotation and the axis
+        # flips are all linear so they are folded into a single 2x2 matrix
+        # in both directions. This way the per-call cost does not depend on
+        # the orientation or the type of the coordinate system
+        lat_scale = self._metres_per_lat_degree
+        lon_scale = self._metres_per_lon_degree
+        self._x_from_lat = self._xmul * self._cos_alpha * lat_scale
+        self._x_from_lon = self._xmul * self._sin_alpha * lon_scale
+        self._y_from_lat = -self._ymul * self._sin_alpha * lat_scale
+        self._y_from_lon = self._ymul * self._cos_alpha * lon_scale
+
+        lat_scale = 1.0 / self._metres_per_lat_degree
+        lon_scale = 1.0 / self._metres_per_lon_degree
+        self._lat_from_x = self._xmul * self._cos_alpha * lat_scale
+        self._lat_from_y = -self._ymul * self._sin_alpha * lat_scale
+        self._lon_from_x = self._xmul * self._sin_alpha * lon_scale
+        self._lon_from_y = self._ymul * self._cos_alpha * lon_scale
+
     def to_flat_earth(self, coord: GPSCoordinate) -> FlatEarthCoordinate:
         """Converts the given GPS coordinates to flat Earth coordinates.
 
@@ -949,21 +1192,20 @@ class FlatEarthToGPSCoordinateTransformation:
         Returns:
             the converted coordinate
         """
-        x, y = (
-            radians(coord.lat - self._origin_lat) * self._r1,
-            radians(coord.lon - self._origin_lon)
-            * self._r2_over_cos_origin_lat_in_radians,
-        )
-        x, y = (
-            x * self._cos_alpha + y * self._sin_alpha,
-            -x * self._sin_alpha + y * self._cos_alpha,
-        )
-        return FlatEarthCoordinate(
-            x=x * self._xmul,
-            y=y * self._ymul,
-            amsl=coord.amsl * self._zmul if coord.amsl is not None else None,
-            ahl=coord.ahl * self._zmul if coord.ahl is not None else None,
-            agl=coord.agl * self._zmul if coord.agl is not None else None,
+        # Altitudes are read directly from the underlying fields to avoid
+        # going through the property getters twice for each of them
+        amsl, ahl, agl = coord._amsl, coord._ahl, coord._agl
+        zmul = self._zmul
+
+        dlat = coord._lat - self._origin_lat
+        dlon = coord._lon - self._origin_lon
+
+        return FlatEarthCoordinate._from_floats(
+            dlat * self._x_from_lat + dlon * self._x_from_lon,
+            dlat * self._y_from_lat + dlon * self._y_from_lon,
+            amsl * zmul if amsl is not None else None,
+            ahl * zmul if ahl is not None else None,
+            agl * zmul if agl is not None else None,
         )
 
     def to_gps(self, coord: FlatEarthCoordinate) -> GPSCoordinate:
@@ -975,20 +1217,15 @@ class FlatEarthToGPSCoordinateTransformation:
         Returns:
             the converted coordinate
         """
-        x, y = (coord.x * self._xmul, coord.y * self._ymul)
-
-        x, y = (
-            x * self._cos_alpha - y * self._sin_alpha,
-            x * self._sin_alpha + y * self._cos_alpha,
-        )
+        amsl, ahl, agl = coord._amsl, coord._ahl, coord._agl
+        zmul = self._zmul
 
-        lat = degrees(x / self._r1)
-        lon = degrees(y / self._r2_over_cos_origin_lat_in_radians)
+        x, y = coord._x, coord._y
 
-        return GPSCoordinate(
-            lat=lat + self._origin_lat,
-            lon=lon + self._origin_lon,
-            amsl=coord.amsl * self._zmul if coord.amsl is not None else None,
-            ahl=coord.ahl * self._zmul if coord.ahl is not None else None,
-            agl=coord.agl * self._zmul if coord.agl is not None else None,
+        return GPSCoordinate._from_floats(
+            x * self._lat_from_x + y * self._lat_from_y + self._origin_lat,
+            x * self._lon_from_x + y * self._lon_from_y + self._origin_lon,
+            amsl * zmul if amsl is not None else None,
+            ahl * zmul if ahl is not None else None,
+            agl * zmul if agl is not None else None,
         )
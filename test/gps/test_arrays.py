@@ -0,0 +1,142 @@
+"""Unit tests for ``flockwave.gps.arrays``."""
+
+from flockwave.gps.distances import haversine
+from flockwave.gps.vectors import (
+    ECEFCoordinate,
+    ECEFToGPSCoordinateTransformation,
+    GPSCoordinate,
+)
+
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if numpy is not None:
+    from flockwave.gps.arrays import ECEFCoordinateArray, GPSCoordinateArray
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class GPSCoordinateArrayTest(unittest.TestCase):
+    """Unit tests for the GPSCoordinateArray_ class."""
+
+    def test_construction(self):
+        arr = GPSCoordinateArray([47, 48], [19, 20], amsl=[100, 200])
+        self.assertEqual(2, len(arr))
+        self.assertEqual(numpy.float64, arr.lat.dtype)
+        self.assertTrue(numpy.isnan(arr.ahl).all())
+        self.assertTrue(numpy.isnan(arr.agl).all())
+
+        with self.assertRaises(ValueError):
+            GPSCoordinateArray([47, 48], [19])
+
+        self.assertEqual(0, len(GPSCoordinateArray()))
+
+    def test_from_coordinates(self):
+        coords = [
+            GPSCoordinate(lat=47, lon=19, amsl=100),
+            GPSCoordinate(lat=48, lon=20, ahl=5, agl=3),
+        ]
+        arr = GPSCoordinateArray.from_coordinates(coords)
+        self.assertEqual(2, len(arr))
+        self.assertTrue(arr.lat.flags["C_CONTIGUOUS"])
+        self.assertTrue(arr.agl.flags["C_CONTIGUOUS"])
+        for index, coord in enumerate(coords):
+            self.assertEqual(_unpack(coord), _unpack(arr[index]))
+
+        self.assertEqual(0, len(GPSCoordinateArray.from_coordinates([])))
+
+    def test_haversine_to(self):
+        coords = [
+            GPSCoordinate(lat=45.7597, lon=4.8422),
+            GPSCoordinate(lat=55 + 45 / 60, lon=37 + 37 / 60),
+            GPSCoordinate(lat=-33.5, lon=151.25),
+            GPSCoordinate(lat=48.8567, lon=2.3508),
+        ]
+        paris = coords[-1]
+        arr = GPSCoordinateArray.from_coordinates(coords)
+
+        result = arr.haversine_to(paris)
+        self.assertEqual((4,), result.shape)
+        for index, coord in enumerate(coords):
+            self.assertAlmostEqual(haversine(coord, paris), result[index], places=6)
+
+    def test_getitem_and_append(self):
+        arr = GPSCoordinateArray()
+        arr.append(GPSCoordinate(lat=47, lon=19, amsl=100))
+        arr.append(GPSCoordinate(lat=48, lon=20, ahl=5, agl=3))
+        self.assertEqual(2, len(arr))
+
+        first, second = arr[0], arr[-1]
+        self.assertEqual((47, 19, 100, None, None), _unpack(first))
+        self.assertEqual((48, 20, None, 5, 3), _unpack(second))
+
+    def test_to_ecef_array(self):
+        trans = ECEFToGPSCoordinateTransformation()
+        coords = [
+            GPSCoordinate(lat=49, lon=17, amsl=1000),
+            GPSCoordinate(lat=-33.5, lon=151.25, amsl=20),
+            GPSCoordinate(lat=90, lon=0, amsl=0),
+        ]
+        arr = GPSCoordinateArray(
+            [c.lat for c in coords],
+            [c.lon for c in coords],
+            amsl=[c.amsl for c in coords],
+        )
+
+        result = arr.to_ecef_array(trans)
+        self.assertIsInstance(result, ECEFCoordinateArray)
+        self.assertEqual(3, len(result))
+        for index, coord in enumerate(coords):
+            expected = trans.to_ecef(coord)
+            self.assertAlmostEqual(expected.x, result[index].x, places=6)
+            self.assertAlmostEqual(expected.y, result[index].y, places=6)
+            self.assertAlmostEqual(expected.z, result[index].z, places=6)
+
+        with self.assertRaises(ValueError):
+            GPSCoordinateArray([47], [19]).to_ecef_array(trans)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class ECEFCoordinateArrayTest(unittest.TestCase):
+    """Unit tests for the ECEFCoordinateArray_ class."""
+
+    def test_to_gps_array(self):
+        trans = ECEFToGPSCoordinateTransformation()
+        coords = [
+            ECEFCoordinate(4009873, 1225941, 4791313),
+            ECEFCoordinate(-4646000, 2553000, -3534000),
+            ECEFCoordinate(0, 0, 6356852.314),
+            ECEFCoordinate(100, 200, -6356752.314),
+            ECEFCoordinate(26_000_000, 0, 0),
+            ECEFCoordinate(0, 0, 0),
+        ]
+        arr = ECEFCoordinateArray([[c.x, c.y, c.z] for c in coords])
+
+        result = arr.to_gps_array(trans)
+        self.assertIsInstance(result, GPSCoordinateArray)
+        self.assertEqual(6, len(result))
+        for index, coord in enumerate(coords):
+            expected = trans.to_gps(coord)
+            self.assertAlmostEqual(expected.lat, result[index].lat, places=9)
+            self.assertAlmostEqual(expected.lon, result[index].lon, places=9)
+            self.assertAlmostEqual(expected.amsl, result[index].amsl, places=5)
+
+    def test_construction(self):
+        arr = ECEFCoordinateArray([[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(2, len(arr))
+        self.assertEqual([1, 4], arr.x.tolist())
+        self.assertEqual([2, 5], arr.y.tolist())
+        self.assertEqual([3, 6], arr.z.tolist())
+        self.assertEqual((4, 5, 6), (arr[1].x, arr[1].y, arr[1].z))
+
+        self.assertEqual(0, len(ECEFCoordinateArray()))
+
+        with self.assertRaises(ValueError):
+            ECEFCoordinateArray([[1, 2], [3, 4]])
+
+
+def _unpack(coord):
+    return coord.lat, coord.lon, coord.amsl, coord.ahl, coord.agl
@@ -1,10 +1,17 @@
 """Unit tests for ``flockwave.gps.distances``."""
 
-from flockwave.gps.distances import haversine
+from math import pi
+
+from flockwave.gps.distances import haversine, haversine_many
 from flockwave.gps.vectors import GPSCoordinate
 
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class PlanetCalcDatum(object):
     """Datum that uses the same mean radius as the one on
@@ -43,3 +50,46 @@ class HaversineTest(unittest.TestCase):
         self.assertAlmostEqual(
             392216.71780659, haversine(lyon, paris, datum=SimplifiedDatum), places=6
         )
+
+    def test_special_cases(self):
+        """Tests the Haversine formula for coincident and antipodal points."""
+        radius = SimplifiedDatum.MEAN_RADIUS_IN_METERS
+        point = GPSCoordinate(lat=47.5, lon=19.25)
+        self.assertEqual(0, haversine(point, point, datum=SimplifiedDatum))
+
+        for first, second in [
+            (GPSCoordinate(lat=0, lon=0), GPSCoordinate(lat=0, lon=180)),
+            (GPSCoordinate(lat=90, lon=0), GPSCoordinate(lat=-90, lon=0)),
+            (GPSCoordinate(lat=30, lon=-60), GPSCoordinate(lat=-30, lon=120)),
+        ]:
+            self.assertAlmostEqual(
+                pi * radius, haversine(first, second, datum=SimplifiedDatum), places=3
+            )
+            self.assertAlmostEqual(
+                pi * radius, haversine(second, first, datum=SimplifiedDatum), places=3
+            )
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_haversine_many(self):
+        """Tests the vectorized variant of the Haversine formula."""
+        paris = GPSCoordinate(lat=48.8567, lon=2.3508)
+        points = [
+            GPSCoordinate(lat=45.7597, lon=4.8422),
+            GPSCoordinate(lat=55 + 45 / 60, lon=37 + 37 / 60),
+            GPSCoordinate(lat=-33.5, lon=151.25),
+            paris,
+        ]
+
+        result = haversine_many(
+            paris,
+            [point.lat for point in points],
+            [point.lon for point in points],
+            datum=SimplifiedDatum,
+        )
+        self.assertEqual((4,), result.shape)
+        for index, point in enumerate(points):
+            self.assertAlmostEqual(
+                haversine(paris, point, datum=SimplifiedDatum),
+                result[index],
+                places=6,
+            )
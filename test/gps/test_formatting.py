@@ -24,6 +24,8 @@ from flockwave.gps.vectors import GPSCoordinate
         (2, ("0200.0000", "N")),
         (2.025, ("0201.5000", "N")),
         (39 + 7.356 / 60, ("3907.3560", "N")),
+        (1.99999999, ("0200.0000", "N")),
+        (-(47 + 59.99996 / 60), ("4800.0000", "S")),
     ],
 )
 def test_format_latitude_for_nmea_gga_message(input: float, output: tuple[str, str]):
@@ -44,6 +46,7 @@ def test_format_latitude_for_nmea_gga_message(input: float, output: tuple[str, s
         (2, ("00200.0000", "E")),
         (123.025, ("12301.5000", "E")),
         (-(121 + 2.482 / 60), ("12102.4820", "W")),
+        (-179.999999999, ("18000.0000", "W")),
     ],
 )
 def test_format_longitude_for_nmea_gga_message(input: float, output: tuple[str, str]):
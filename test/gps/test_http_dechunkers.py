@@ -0,0 +1,51 @@
+from flockwave.gps.http.dechunkers import NullDechunker, ResponseDechunker
+
+from pytest import raises
+
+DATA = b"4\r\nWiki\r\n5\r\npedia\r\nE\r\n in\r\n\r\nchunks.\r\n0\r\n\r\n"
+EXPECTED = b"Wikipedia in\r\n\r\nchunks."
+
+
+def test_null_dechunker():
+    dechunker = NullDechunker()
+    assert dechunker.feed(DATA) == DATA
+
+
+def test_dechunker_in_one_go():
+    dechunker = ResponseDechunker()
+    assert dechunker.feed(DATA) == EXPECTED
+
+
+def test_dechunker_with_split_input():
+    for size in (1, 2, 3, 5, 7, 16):
+        dechunker = ResponseDechunker()
+        result = b"".join(
+            dechunker.feed(DATA[i : (i + size)]) for i in range(0, len(DATA), size)
+        )
+        assert result == EXPECTED
+
+
+def test_dechunker_with_long_chunk():
+    body = bytes(range(256)) * 16
+    data = b"%X\r\n" % len(body) + body + b"\r\n0\r\n\r\n"
+
+    dechunker = ResponseDechunker()
+    assert dechunker.feed(bytearray(data)) == body
+
+
+def test_dechunker_protocol_violations():
+    for data in (b"4x\r\n", b"+4\r\n", b"4\rX", b"1\r\nAB", b"1\r\nA\rB"):
+        dechunker = ResponseDechunker()
+        with raises(ValueError, match="protocol violation"):
+            dechunker.feed(data)
+
+
+def test_feed_into():
+    for dechunker, expected in (
+        (NullDechunker(), DATA),
+        (ResponseDechunker(), EXPECTED),
+    ):
+        out = bytearray(b"prefix:")
+        for i in range(0, len(DATA), 8):
+            dechunker.feed_into(DATA[i : (i + 8)], out)
+        assert out == b"prefix:" + expected
@@ -0,0 +1,51 @@
+from flockwave.gps.http.request import Request
+
+from pytest import importorskip
+
+trio = importorskip("trio")
+
+
+async def _send_and_capture(request: Request, listener) -> bytes:
+    """Sends the given request to the given listener and returns the raw
+    bytes received by the listener.
+    """
+    async with trio.open_nursery() as nursery:
+        nursery.start_soon(request.send)
+        server_stream = await listener.accept()
+        data = bytearray()
+        while not data.endswith(b"\r\n\r\n"):
+            data += await server_stream.receive_some()
+        await server_stream.aclose()
+    return bytes(data)
+
+
+def test_request_serialization():
+    async def main():
+        listeners = await trio.open_tcp_listeners(0, host="127.0.0.1")
+        listener = listeners[0]
+        port = listener.socket.getsockname()[1]
+
+        request = Request(
+            f"http://127.0.0.1:{port}/MOUNT POINT".encode("ascii"),
+            headers={"user-agent": b"NTRIP test", "ntrip-version": b"Ntrip/2.0"},
+        )
+
+        with trio.fail_after(5):
+            for _ in range(2):
+                data = await _send_and_capture(request, listener)
+                assert data == (
+                    b"GET /MOUNT%20POINT HTTP/1.1\r\n"
+                    b"User-Agent: NTRIP test\r\n"
+                    b"Ntrip-version: Ntrip/2.0\r\n"
+                    b"Host: 127.0.0.1:" + str(port).encode("ascii") + b"\r\n"
+                    b"Connection: close\r\n"
+                    b"\r\n"
+                )
+
+            request.url = f"http://127.0.0.1:{port}/OTHER".encode("ascii")
+            data = await _send_and_capture(request, listener)
+            assert data.startswith(b"GET /OTHER HTTP/1.1\r\n")
+
+        await listener.aclose()
+
+    trio.run(main)
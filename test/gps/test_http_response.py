@@ -0,0 +1,124 @@
+from flockwave.gps.http.errors import (
+    AccessDeniedError,
+    AuthenticationNeededError,
+    NotFoundError,
+    ResponseError,
+)
+from flockwave.gps.http.response import LineReader, Response
+
+from pytest import importorskip, raises
+
+trio = importorskip("trio")
+
+
+def test_response_body_read_together_with_headers():
+    from trio.testing import memory_stream_pair
+
+    async def main():
+        client, server = memory_stream_pair()
+        await server.send_all(
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+            b"4\r\nWiki\r\n5\r\npedia\r\n"
+        )
+
+        response = Response(client)
+        with trio.fail_after(1):
+            assert await response.receive_some() == b"Wikipedia"
+
+        await server.send_all(b"3\r\nabc\r\n0\r\n\r\n")
+        with trio.fail_after(1):
+            assert await response.receive_some() == b"abc"
+
+        assert response.protocol == b"HTTP/1.1"
+        assert response.getheader("transfer-encoding") == b"chunked"
+
+    trio.run(main)
+
+
+def test_error_responses():
+    from trio.testing import memory_stream_pair
+
+    async def main(status_line: bytes):
+        client, server = memory_stream_pair()
+        await server.send_all(status_line + b"\r\n\r\n")
+        with trio.fail_after(1):
+            await Response(client).ensure_headers_processed()
+
+    for status_line, error_class in (
+        (b"HTTP/1.1 401 Unauthorized", AuthenticationNeededError),
+        (b"HTTP/1.1 403 Forbidden", AccessDeniedError),
+        (b"HTTP/1.1 404 Not Found", NotFoundError),
+        (b"HTTP/1.1 500 Internal Server Error", ResponseError),
+    ):
+        with raises(error_class):
+            trio.run(main, status_line)
+
+
+def test_unchunked_response():
+    from trio.testing import memory_stream_pair
+
+    async def main():
+        client, server = memory_stream_pair()
+        await server.send_all(b"ICY 200 OK\r\nsome data")
+
+        response = Response(client)
+        with trio.fail_after(1):
+            assert await response.receive_some() == b"some data"
+
+        await server.send_all(b"more data")
+        with trio.fail_after(1):
+            assert await response.receive_some(4) == b"more"
+            assert await response.receive_some() == b" data"
+
+        assert response.protocol == b"ICY"
+        assert response.headers == {}
+
+    trio.run(main)
+
+
+def test_body_bytes_read_together_with_headers_are_returned_first():
+    from trio.testing import memory_stream_pair
+
+    async def main():
+        client, server = memory_stream_pair()
+        await server.send_all(b"HTTP/1.1 200 OK\r\n\r\nhello world")
+
+        response = Response(client)
+        with trio.fail_after(1):
+            assert await response.receive_some(3) == b"hel"
+            assert await response.receive_some(2) == b"lo"
+            assert await response.receive_some() == b" world"
+
+        await server.send_all(b"from the stream")
+        with trio.fail_after(1):
+            assert await response.receive_some() == b"from the stream"
+
+    trio.run(main)
+
+
+def test_line_reader():
+    from trio.testing import memory_stream_pair
+
+    async def main():
+        client, server = memory_stream_pair()
+        reader = LineReader(client, max_line_length=16)
+
+        await server.send_all(b"first\r\nsec")
+        with trio.fail_after(1):
+            assert await reader.readline() == b"first\r\n"
+
+        await server.send_all(b"ond\r\nthird")
+        with trio.fail_after(1):
+            assert await reader.readline() == b"second\r\n"
+
+        assert reader.get_remainder() == b"third"
+
+        await server.send_all(b"x" * 20)
+        with raises(ValueError, match="too long"):
+            with trio.fail_after(1):
+                await reader.readline()
+
+        await server.aclose()
+        assert await LineReader(client).readline() == b""
+
+    trio.run(main)
@@ -0,0 +1,47 @@
+from flockwave.gps.javad.rtk_config import JavadRTKBaseConfigurator
+from flockwave.gps.rtk import RTKSurveySettings
+
+from pytest import raises
+
+
+def _run_configurator(settings: RTKSurveySettings) -> tuple[list[bytes], list[float]]:
+    writes: list[bytes] = []
+    sleeps: list[float] = []
+
+    async def write(data: bytes) -> None:
+        writes.append(data)
+
+    async def sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    # The configurator only awaits the functions above, which never suspend,
+    # so a single send() runs the coroutine to completion
+    coro = JavadRTKBaseConfigurator(settings).run(write, sleep)
+    with raises(StopIteration):
+        coro.send(None)
+
+    return writes, sleeps
+
+
+def test_javad_rtk_base_configuration():
+    settings = RTKSurveySettings()
+    settings.set_gnss_types(["gps", "glonass"])
+    settings.duration = 60
+
+    writes, sleeps = _run_configurator(settings)
+
+    # Each command is sent in its own write and followed by its own delay
+    assert sleeps == [0.1] * len(writes)
+    assert writes == [
+        command + b"\r\n"
+        for command in (
+            b"dm,/cur/term",
+            b"set,/par/ref/avg/span,60",
+            b"set,/par/ref/avg/mode,on",
+            b"set,/par/pos/sys/gps,y",
+            b"set,/par/pos/sys/glo,y",
+            b"set,/par/pos/fix/alt,off",
+            b"em,,/msg/rtcm3/{1006:5,1077,1087,1230:5}:1",
+            b"em,,/msg/nmea/GST:1",
+        )
+    ]
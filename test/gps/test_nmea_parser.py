@@ -1,4 +1,7 @@
+import pynmea2
+
 from flockwave.gps.nmea import create_nmea_parser
+from flockwave.gps.nmea.packet import create_talker_sentence
 
 
 def test_nmea_parser():
@@ -26,3 +29,46 @@ $GPRMC,092751.000,A,5321.6802,N,00630.3371,W,0.06,31.66,280511,,,A*45
     assert len(result) == 12
     assert result[0].num_sats == "8"
     assert result[6].num_sats == "8"
+
+
+def test_nmea_parser_sentence_variants():
+    data = b"""$GPGGA,092750.000,5321.6802,N,00630.3372,W,1,8,1.03,61.7,M,55.2,M,,*77
+$gpgga,092750.000,5321.6802,N,00630.3372,W,1,8,1.03,61.7,M,55.2,M,,*56
+$GPGGA,092750.000,5321.6802,N,00630.3372,W,1,8,1.03,61.7,M,55.2,M,,
+$PGRME,15.0,M,45.0,M,25.0,M*1C
+$CCGPQ,GGA*2B
+$pPGGA,092750.000,5321.6802,N,00630.3372,W,1,8,1.03,61.7,M,55.2,M,,*41
+"""
+
+    parser = create_nmea_parser()
+    result = parser(data)
+
+    # The first sentence has an invalid checksum
+    assert [str(packet) for packet in result] == [
+        "$GPGGA,092750.000,5321.6802,N,00630.3372,W,1,8,1.03,61.7,M,55.2,M,,*76",
+        "$GPGGA,092750.000,5321.6802,N,00630.3372,W,1,8,1.03,61.7,M,55.2,M,,*76",
+        "$PGRME,15.0,M,45.0,M,25.0,M*1C",
+        "$CCGPQ,GGA*2B",
+        "$PPGGA,092750.000,5321.6802,N,00630.3372,W,1,8,1.03,61.7,M,55.2,M,,*61",
+    ]
+    assert result[0].talker == "GP"
+    assert result[0].altitude == 61.7
+
+    # Proprietary sentences are recognized regardless of case
+    assert type(result[4]).__name__ == "ProprietarySentence"
+
+
+def test_nmea_parser_sentence_registered_later():
+    class ZZT(pynmea2.TalkerSentence):
+        fields = (("Value", "value"),)
+
+    try:
+        assert type(create_talker_sentence("GP", "ZZT", ["1"])) is ZZT
+
+        parser = create_nmea_parser()
+        packet = pynmea2.TalkerSentence("GP", "ZZT", ["42"])
+        (result,) = parser(str(packet).encode("ascii") + b"\r\n")
+        assert type(result) is ZZT
+        assert result.value == "42"
+    finally:
+        del pynmea2.TalkerSentence.sentence_types["ZZT"]
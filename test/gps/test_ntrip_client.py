@@ -0,0 +1,65 @@
+from flockwave.gps.ntrip.client import (
+    NtripClient,
+    NtripClientConnectionInfo,
+)
+
+
+def test_create_connection_info_from_uri():
+    info = NtripClientConnectionInfo.create_from_uri("ntrip://user:pw@host:2102/MP")
+    assert info == NtripClientConnectionInfo(
+        host="host",
+        port=2102,
+        username="user",
+        password="pw",
+        mountpoint="MP",
+        version=2,
+    )
+
+    info = NtripClientConnectionInfo.create_from_uri("ntrip1://152.66.6.49/RTCM23")
+    assert info == NtripClientConnectionInfo(
+        host="152.66.6.49", mountpoint="RTCM23", version=1
+    )
+
+    info = NtripClientConnectionInfo.create_from_uri("ntrip://u:@h:1/a/b")
+    assert info.username == "u"
+    assert info.password == ""
+    assert info.mountpoint == "a/b"
+
+    info = NtripClientConnectionInfo.create_from_uri("ntrip://host/")
+    assert info.port == 2101
+    assert info.username is None
+    assert info.mountpoint is None
+
+
+def test_connection_info_from_same_uri_is_not_shared():
+    uri = "ntrip://user:pw@host/MP"
+    first = NtripClientConnectionInfo.create_from_uri(uri)
+    first.mountpoint = "OTHER"
+
+    second = NtripClientConnectionInfo.create_from_uri(uri)
+    assert first is not second
+    assert second.mountpoint == "MP"
+
+
+def test_authorization_header():
+    client = NtripClient.create("ntrip://host/MP")
+    assert client._get_authorization_header() is None
+
+    client = NtripClient.create("ntrip://Aladdin:open sesame@host/MP")
+    header = client._get_authorization_header()
+    assert header == b"Basic QWxhZGRpbjpvcGVuIHNlc2FtZQ=="
+    assert client._get_authorization_header() is header
+
+    client.connection_info.password = "other"
+    assert client._get_authorization_header() == b"Basic QWxhZGRpbjpvdGhlcg=="
+
+
+def test_url_for_mountpoint():
+    client = NtripClient.create("ntrip://host:2102/MP")
+    url = client._url_for_mountpoint()
+    assert url == b"http://host:2102/MP"
+    assert client._url_for_mountpoint() is url
+    assert client._url_for_mountpoint("OTHER") == b"http://host:2102/OTHER"
+
+    client.connection_info.port = 2101
+    assert client._url_for_mountpoint() == b"http://host:2101/MP"
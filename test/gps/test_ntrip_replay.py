@@ -0,0 +1,44 @@
+from pytest import approx, importorskip
+
+importorskip("click")
+
+from flockwave.gps.ntrip.replay import _RecordCoalescer, ntrip_replayer  # noqa: E402
+
+
+def _coalesce(records):
+    coalescer = _RecordCoalescer()
+    result = [coalescer.push(delay, chunk) for delay, chunk in records]
+    result.append(coalescer.flush())
+    return [record for record in result if record is not None]
+
+
+def test_coalesce_records():
+    records = [
+        (0.0, b"a"),
+        (0.005, b"b"),
+        (0.01, b"c"),
+        (0.01, b"d"),
+        (1.0, b"e"),
+        (0.5, b"f"),
+        (0.001, b"g"),
+        (0.5, b"h"),
+    ]
+    result = _coalesce(records)
+
+    assert [chunk for _, chunk in result] == [b"abc", b"d", b"e", b"fg", b"h"]
+    assert [delay for delay, _ in result] == approx([0.0, 0.025, 1.0, 0.5, 0.501])
+
+
+def test_coalesce_records_size_limit():
+    records = [(0.0, b"x" * 10000), (0.0, b"y" * 10000), (0.0, b"z")]
+    result = _coalesce(records)
+    assert [len(chunk) for _, chunk in result] == [10000, 10001]
+
+
+def test_coalesce_empty_recording():
+    assert _coalesce([]) == []
+
+
+def test_coalescing_is_opt_in():
+    options = {param.name: param for param in ntrip_replayer.params}
+    assert options["coalesce"].default is False
@@ -0,0 +1,52 @@
+from flockwave.gps.crc import crc24q
+from flockwave.gps.nmea.packet import NMEAPacket
+from flockwave.gps.parser import create_gps_parser
+from flockwave.gps.rtcm.packets import RTCMV3StationaryAntennaPacket
+from flockwave.gps.ubx import UBXPacket
+
+
+def _rtcm3_frame(body: bytes) -> bytes:
+    header = bytes([0xD3, len(body) >> 8, len(body) & 0xFF])
+    parity = crc24q(header + body)
+    return header + body + bytes([parity >> 16, (parity >> 8) & 0xFF, parity & 0xFF])
+
+
+NMEA = b"$GPGGA,092750.000,5321.6802,N,00630.3372,W,1,8,1.03,61.7,M,55.2,M,,*76\r\n"
+RTCM3 = _rtcm3_frame(bytes([0x3E, 0xD0]) + bytes(17))
+UBX = b"\xb5b\n\x04\x0a\x00EXT CORE 1\xa3'"
+
+DATA = NMEA + RTCM3 + b"garbage" + UBX + NMEA + UBX + RTCM3 + NMEA
+
+
+def test_combined_parser():
+    expected_types = [
+        NMEAPacket,
+        RTCMV3StationaryAntennaPacket,
+        UBXPacket,
+        NMEAPacket,
+        UBXPacket,
+        RTCMV3StationaryAntennaPacket,
+        NMEAPacket,
+    ]
+
+    for size in (1, 7, 64, len(DATA)):
+        parser = create_gps_parser()
+        result = []
+        for i in range(0, len(DATA), size):
+            result.extend(parser(DATA[i : (i + size)]))
+
+        assert len(result) == len(expected_types)
+        for message, expected_type in zip(result, expected_types):
+            assert isinstance(message, expected_type)
+
+
+def test_single_format_parser():
+    parser = create_gps_parser(["ubx"])
+    result = parser(DATA)
+    assert len(result) == 2
+    assert all(message.payload == b"EXT CORE 1" for message in result)
+
+
+def test_no_formats():
+    parser = create_gps_parser([])
+    assert not parser(DATA)
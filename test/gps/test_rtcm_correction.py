@@ -0,0 +1,55 @@
+from copy import copy, deepcopy
+from dataclasses import FrozenInstanceError
+from pickle import dumps, loads
+
+from flockwave.gps.rtcm import CorrectionData
+from flockwave.gps.rtcm.encoders import RTCMV2Encoder
+from flockwave.gps.rtcm.packets import RTCMV2FullCorrectionsPacket
+from flockwave.gps.rtcm.parsers import RTCMV2Parser
+
+from pytest import raises
+
+
+def test_correction_data():
+    correction = CorrectionData(svid=3, prc=1234, prrc=-5, iode=7)
+    assert correction.scale_factor == 0
+    assert correction.scaled_prc == 1234
+    assert correction.scaled_prrc == -5
+
+    correction = CorrectionData(svid=12, prc=-40000, prrc=3000, iode=9)
+    assert correction.scale_factor == 1
+    assert correction.scaled_prc == -2500
+    assert correction.scaled_prrc == 127
+
+    assert correction == CorrectionData(12, -40000, 3000, 9)
+    assert repr(correction) == "CorrectionData(svid=12, prc=-40000, prrc=3000, iode=9)"
+    with raises(AttributeError):
+        correction.foo = 42  # type: ignore
+    with raises(FrozenInstanceError):
+        correction.prc = 1  # type: ignore
+    assert correction.scaled_prc == -2500
+
+
+def test_correction_data_copy_and_pickle():
+    correction = CorrectionData(svid=12, prc=-40000, prrc=3000, iode=9)
+    for clone in (copy(correction), deepcopy(correction), loads(dumps(correction))):
+        assert clone == correction
+        assert clone is not correction
+        assert clone.scale_factor == 1
+        assert clone.scaled_prc == -2500
+        assert clone.scaled_prrc == 127
+
+
+def test_full_corrections_packet_round_trip():
+    corrections = [
+        CorrectionData(svid=3, prc=1234, prrc=-5, iode=7),
+        CorrectionData(svid=12, prc=-40000, prrc=96, iode=9),
+    ]
+    packet = RTCMV2FullCorrectionsPacket(station_id=5, corrections=corrections)
+    data = RTCMV2Encoder().encode(packet, time_of_week=1000)
+
+    parsed = RTCMV2Parser().feed(data)
+    assert len(parsed) == 1
+    assert isinstance(parsed[0], RTCMV2FullCorrectionsPacket)
+    assert parsed[0].station_id == 5
+    assert parsed[0].corrections == corrections
@@ -93,6 +93,153 @@ class JSONFormatTest(unittest.TestCase):
         self.assertEqual(None, vec.ahl)
         self.assertEqual(9, vec.agl)
 
+    def test_json_shapes_and_types(self):
+        """Tests the length and the element types of the JSON representation
+        of coordinates with and without altitudes.
+        """
+        for cls in (GPSCoordinate, FlatEarthCoordinate):
+            json = cls(1.5, 4.25, amsl=9.0004, ahl=None).json
+            self.assertEqual(4, len(json))
+            self.assertIsNone(json[3])
+            for value in json[:3]:
+                self.assertIs(int, type(value))
+
+            json = cls(1.5, 4.25, agl=2.5).json
+            self.assertEqual([None, None, 2500], json[2:])
+            self.assertIs(int, type(json[4]))
+
+        self.assertEqual([1, 2, -3], VelocityNED(0.0011, 0.0019, -0.003).json)
+
+
+class DistanceTest(unittest.TestCase):
+    """Unit tests for distance calculations between vectors."""
+
+    def test_distance(self):
+        """Tests the ``distance()`` and ``distance_sq()`` methods."""
+        first = Vector3D(x=1, y=2, z=3)
+        second = PositionXYZ(x=4, y=-2, z=15)
+        self.assertEqual(13, first.distance(second))
+        self.assertEqual(13, second.distance(first))
+        self.assertEqual(169, first.distance_sq(second))
+        self.assertEqual(0, first.distance(first))
+
+        # Squaring the components would overflow or underflow here
+        big = Vector3D(3e200, 4e200, 0).distance(Vector3D())
+        self.assertAlmostEqual(5, big / 1e200, places=12)
+        small = Vector3D(3e-200, 4e-200, 0).distance(Vector3D())
+        self.assertAlmostEqual(5, small / 1e-200, places=12)
+
+
+class ConstructorTest(unittest.TestCase):
+    """Unit tests for the constructors of vectors and coordinates."""
+
+    def test_coercion_to_float(self):
+        """Tests whether the constructors convert their arguments to floats."""
+        vec = VelocityNED(north=1, east=2, down=3)
+        for value in (vec.x, vec.y, vec.z):
+            self.assertIs(float, type(value))
+
+        coord = GPSCoordinate(lat=1, lon=2, amsl=3, ahl=4, agl=5)
+        for value in (coord.lat, coord.lon, coord.amsl, coord.ahl, coord.agl):
+            self.assertIs(float, type(value))
+
+        coord = FlatEarthCoordinate(x=1, y=2, amsl=3)
+        for value in (coord.x, coord.y, coord.amsl):
+            self.assertIs(float, type(value))
+        self.assertIsNone(coord.ahl)
+        self.assertIsNone(coord.agl)
+
+
+class CopyTest(unittest.TestCase):
+    """Unit tests for copying and scaling vectors and coordinates."""
+
+    def test_vector_copy_and_arithmetic(self):
+        vec = VelocityNED(north=2, east=4, down=-6)
+
+        for result, expected in [
+            (vec.copy(), (2, 4, -6)),
+            (vec * 2, (4, 8, -12)),
+            (vec / 2, (1, 2, -3)),
+            (vec // 4, (0, 1, -2)),
+        ]:
+            self.assertIsInstance(result, VelocityNED)
+            self.assertIsNot(result, vec)
+            self.assertEqual(expected, (result.north, result.east, result.down))
+
+    def test_coordinate_copy(self):
+        coord = GPSCoordinate(lat=47.5, lon=19.25, amsl=100, agl=5)
+        copy = coord.copy()
+        self.assertIsNot(copy, coord)
+        self.assertEqual(
+            (47.5, 19.25, 100, None, 5),
+            (copy.lat, copy.lon, copy.amsl, copy.ahl, copy.agl),
+        )
+
+        coord = FlatEarthCoordinate(x=1, y=2, ahl=3)
+        copy = coord.copy()
+        self.assertIsNot(copy, coord)
+        self.assertEqual(
+            (1, 2, None, 3, None), (copy.x, copy.y, copy.amsl, copy.ahl, copy.agl)
+        )
+
+
+class UpdateTest(unittest.TestCase):
+    """Unit tests for updating coordinates in place."""
+
+    def test_update(self):
+        coord = GPSCoordinate(lat=47, lon=19, amsl=100)
+        coord.update(lon=20, agl=5)
+        self.assertEqual(
+            (47, 20, 100, None, 5),
+            (coord.lat, coord.lon, coord.amsl, coord.ahl, coord.agl),
+        )
+        self.assertIs(float, type(coord.agl))
+
+        coord.update(lat=47.123456, precision=2)
+        self.assertEqual(47.12, coord.lat)
+
+        coord = FlatEarthCoordinate(x=1, y=2)
+        coord.update(y=3, ahl=4)
+        self.assertEqual(
+            (1, 3, None, 4, None), (coord.x, coord.y, coord.amsl, coord.ahl, coord.agl)
+        )
+        self.assertIs(float, type(coord.ahl))
+
+    def test_update_from(self):
+        coord = GPSCoordinate(lat=47, lon=19, amsl=100)
+        coord.update_from(GPSCoordinate(lat=48, lon=20, agl=5))
+        self.assertEqual(
+            (48, 20, 100, None, 5),
+            (coord.lat, coord.lon, coord.amsl, coord.ahl, coord.agl),
+        )
+
+        coord = FlatEarthCoordinate(x=1, y=2, amsl=3)
+        coord.update_from(FlatEarthCoordinate(x=4, y=5, ahl=6))
+        self.assertEqual(
+            (4, 5, 3, 6, None), (coord.x, coord.y, coord.amsl, coord.ahl, coord.agl)
+        )
+
+
+class SlotsTest(unittest.TestCase):
+    """Unit tests for the memory layout of the coordinate classes."""
+
+    def test_no_instance_dict(self):
+        """Tests whether the coordinate classes (including subclasses) store
+        their attributes in slots instead of a per-instance dictionary.
+        """
+        for obj in (
+            Vector3D(),
+            PositionXYZ(),
+            VelocityXYZ(),
+            VelocityNED(),
+            ECEFCoordinate(),
+            GPSCoordinate(lat=1, lon=4, amsl=9),
+            FlatEarthCoordinate(x=1, y=4, agl=9),
+        ):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+            with self.assertRaises(AttributeError):
+                obj.foo = 42  # type: ignore
+
 
 class ECEFToGPSCoordinateTransformationTest(unittest.TestCase):
     """Unit tests for the ECEFToGPSCoordinateTransformation_ class."""
@@ -112,6 +259,20 @@ class ECEFToGPSCoordinateTransformationTest(unittest.TestCase):
         trans = ECEFToGPSCoordinateTransformation((2, 2))
         self.assertEqual((2.0, 2.0), trans.radii)
 
+        # Changing the radii of one instance must not affect the others that
+        # share the defaults
+        other = ECEFToGPSCoordinateTransformation()
+        trans.radii = other.radii
+        trans.radii = (2, 2)
+        self.assertEqual(
+            (WGS84.EQUATORIAL_RADIUS_IN_METERS, WGS84.POLAR_RADIUS_IN_METERS),
+            other.radii,
+        )
+        lat, lon, amsl = trans.to_gps_raw(3, 0, 0)
+        self.assertAlmostEqual(0, lat)
+        self.assertAlmostEqual(0, lon)
+        self.assertAlmostEqual(1, amsl)
+
     def test_to_ecef(self):
         """Tests whether the ``to_ecef()`` method works."""
         trans = ECEFToGPSCoordinateTransformation()
@@ -124,6 +285,22 @@ class ECEFToGPSCoordinateTransformationTest(unittest.TestCase):
         self.assertAlmostEqual(1225941, ecef_coord.y, places=0)
         self.assertAlmostEqual(4791313, ecef_coord.z, places=0)
 
+    def test_to_ecef_many(self):
+        """Tests whether the ``to_ecef_many()`` method works."""
+        trans = ECEFToGPSCoordinateTransformation()
+
+        gps_coords = [
+            GPSCoordinate(lat=49, lon=17, amsl=1000),
+            GPSCoordinate(lat=-33.5, lon=151.25, amsl=-12.5),
+        ]
+        ecef_coords = trans.to_ecef_many(gps_coords)
+        self.assertEqual([trans.to_ecef(coord) for coord in gps_coords], ecef_coords)
+
+        self.assertEqual([], trans.to_ecef_many([]))
+
+        with self.assertRaises(ValueError):
+            trans.to_ecef_many([GPSCoordinate(lat=49, lon=17)])
+
     def test_to_gps(self):
         """Tests whether the ``to_gps()`` method works."""
         trans = ECEFToGPSCoordinateTransformation()
@@ -138,6 +315,45 @@ class ECEFToGPSCoordinateTransformationTest(unittest.TestCase):
         self.assertTrue(gps_coord.ahl is None)
         self.assertTrue(gps_coord.agl is None)
 
+    def test_to_gps_raw(self):
+        """Tests whether the ``to_gps_raw()`` method works."""
+        trans = ECEFToGPSCoordinateTransformation()
+
+        lat, lon, amsl = trans.to_gps_raw(4009873, 1225941, 4791313)
+        self.assertAlmostEqual(49, lat, places=5)
+        self.assertAlmostEqual(17, lon, places=5)
+        self.assertAlmostEqual(1000, amsl, places=0)
+
+    def test_to_gps_at_center_of_earth(self):
+        """Tests whether the center of the Earth is converted without
+        dividing by zero.
+        """
+        trans = ECEFToGPSCoordinateTransformation()
+
+        gps_coord = trans.to_gps(ECEFCoordinate(0, 0, 0))
+        self.assertEqual(0, gps_coord.lat)
+        self.assertEqual(0, gps_coord.lon)
+        self.assertEqual(-WGS84.EQUATORIAL_RADIUS_IN_METERS, gps_coord.amsl)
+
+    def test_round_trip_far_from_surface(self):
+        """Tests whether the conversion stays accurate at the poles and far
+        above the surface of the Earth.
+        """
+        trans = ECEFToGPSCoordinateTransformation()
+
+        for lat, lon, amsl in [
+            (90, 0, 100),
+            (-90, 0, 100),
+            (45, -120, 20_200_000),
+            (-30, 60, 35_786_000),
+        ]:
+            ecef = trans.to_ecef(GPSCoordinate(lat=lat, lon=lon, amsl=amsl))
+            gps = trans.to_gps(ecef)
+            self.assertAlmostEqual(lat, gps.lat, places=9)
+            if abs(lat) < 90:
+                self.assertAlmostEqual(lon, gps.lon, places=9)
+            self.assertAlmostEqual(amsl, gps.amsl, places=4)
+
 
 class FlatEarthToGPSCoordinateTransformationTest(unittest.TestCase):
     """Unit tests for the FlatEarthToGPSCoordinateTransformation_ class."""
@@ -401,3 +617,52 @@ class FlatEarthToGPSCoordinateTransformationTest(unittest.TestCase):
         self.assertAlmostEqual(
             flat_earth_coord.y, recovered_flat_earth_coord.y, places=5
         )
+
+    def test_round_trip_with_altitudes(self):
+        """Tests whether ``to_flat_earth()`` is the exact inverse of
+        ``to_gps()``, including the handling of altitudes in coordinate
+        systems where the Z axis points down.
+        """
+        origin = GPSCoordinate(lat=49, lon=17)
+        trans = FlatEarthToGPSCoordinateTransformation(
+            origin=origin, type="ned", orientation=30
+        )
+
+        gps_coord = GPSCoordinate(lat=49.01, lon=17.02, amsl=120, agl=15)
+        flat_earth_coord = trans.to_flat_earth(gps_coord)
+        self.assertEqual(-120, flat_earth_coord.amsl)
+        self.assertEqual(-15, flat_earth_coord.agl)
+        self.assertIsNone(flat_earth_coord.ahl)
+
+        recovered_gps_coord = trans.to_gps(flat_earth_coord)
+        self.assertAlmostEqual(gps_coord.lat, recovered_gps_coord.lat, places=10)
+        self.assertAlmostEqual(gps_coord.lon, recovered_gps_coord.lon, places=10)
+        self.assertEqual(120, recovered_gps_coord.amsl)
+        self.assertEqual(15, recovered_gps_coord.agl)
+        self.assertIsNone(recovered_gps_coord.ahl)
+
+    def test_changing_orientation_and_type(self):
+        """Tests whether changing the orientation or the type of an existing
+        transformation is equivalent to constructing a new one.
+        """
+        origin = GPSCoordinate(lat=49, lon=17)
+        gps_coord = GPSCoordinate(lat=49.01, lon=17.02, amsl=120)
+
+        trans = FlatEarthToGPSCoordinateTransformation(origin=origin)
+        trans.orientation = 30
+        trans.type = "ned"
+        expected = FlatEarthToGPSCoordinateTransformation(
+            origin=origin, type="ned", orientation=30
+        )
+
+        actual_coord = trans.to_flat_earth(gps_coord)
+        expected_coord = expected.to_flat_earth(gps_coord)
+        self.assertAlmostEqual(expected_coord.x, actual_coord.x, places=10)
+        self.assertAlmostEqual(expected_coord.y, actual_coord.y, places=10)
+        self.assertEqual(expected_coord.amsl, actual_coord.amsl)
+
+        flat_earth_coord = FlatEarthCoordinate(x=100, y=-50)
+        actual_coord = trans.to_gps(flat_earth_coord)
+        expected_coord = expected.to_gps(flat_earth_coord)
+        self.assertAlmostEqual(expected_coord.lat, actual_coord.lat, places=10)
+        self.assertAlmostEqual(expected_coord.lon, actual_coord.lon, places=10)